@@ -1,16 +1,24 @@
 import os
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-import vertexai
-from vertexai.generative_models import GenerativeModel
+import httpx
+from google import genai
+from google.genai import types
 
 load_dotenv()
 
+# Per-request timeout (seconds) for each model probe
+PROBE_TIMEOUT = 10
+
 project_id = os.getenv("GOOGLE_PROJECT_ID")
 location = os.getenv("GOOGLE_LOCATION", "us-central1")
 
 print(f"Checking models for Project: {project_id}, Location: {location}")
 
-vertexai.init(project=project_id, location=location)
+# Models that didn't answer within PROBE_TIMEOUT (the script exits non-zero)
+timed_out = []
 
 print("\n--- Listing ALL Available Models ---")
 try:
@@ -20,9 +28,8 @@ try:
     if not models:
         print("No custom models found (this is expected for foundation models).")
         
-    # For foundation models, we can't easily "list" them via SDK in a simple way 
-    # without using the Model Garden API which is complex.
-    # Instead, let's try a broader list of known recent candidates including experimental ones.
+    # Known recent candidates including experimental ones; only those the
+    # Model Garden lists below get a (billable) generate_content probe
     candidates = [
         # Gemini 2.0 models (production)
         "gemini-2.0-flash-001",
@@ -39,20 +46,74 @@ try:
         "gemini-1.5-pro",
     ]
 
-    print("\nTesting specific model candidates:")
-    for model_name in candidates:
+    # One Model Garden listing call, so candidates that aren't published in
+    # this project/location are skipped instead of each costing a probe
+    try:
+        from google.cloud import aiplatform_v1beta1
+        garden = aiplatform_v1beta1.ModelGardenServiceClient(
+            client_options={"api_endpoint": f"{location}-aiplatform.googleapis.com"}
+        )
+        # Listed unfiltered: the filter argument takes "field=value"
+        # expressions, so match gemini client-side
+        published = {
+            m.name.rsplit("/", 1)[-1]
+            for m in garden.list_publisher_models(parent="publishers/google")
+            if "gemini" in m.name.rsplit("/", 1)[-1]
+        }
+        if not published:
+            raise ValueError("no gemini publisher models returned")
+        # Listings name base models ("gemini-1.5-flash"); a versioned id
+        # ("gemini-1.5-flash-002") is kept when its base model is listed.
+        # Only a trailing -NNN is stripped, so e.g. a preview id isn't let
+        # through just because its stable model is listed.
+        skipped = [c for c in candidates
+                   if c not in published and re.sub(r"-\d{3}$", "", c) not in published]
+        candidates = [c for c in candidates if c not in skipped]
+        for model_name in skipped:
+            print(f"❌ {model_name}: Not listed in Model Garden")
+    except Exception as e:
+        print(f"Warning: Model Garden listing failed ({type(e).__name__}: {e}), probing every candidate")
+
+    if not candidates:
+        raise SystemExit("No candidate models are listed for this project/location.")
+
+    # google-genai takes a per-request timeout (in ms); the vertexai SDK's
+    # generate_content has none
+    client = genai.Client(
+        vertexai=True, project=project_id, location=location,
+        http_options=types.HttpOptions(timeout=PROBE_TIMEOUT * 1000)
+    )
+
+    def probe(model_name):
+        """Return (model_name, status, error message) for one candidate; status is ok, timeout or error"""
         try:
-            model = GenerativeModel(model_name)
             # We need to actually call it to see if we have access
-            response = model.generate_content("Hi", stream=False)
-            print(f"✅ {model_name} is AVAILABLE and WORKING!")
+            client.models.generate_content(model=model_name, contents="Hi")
+            return model_name, "ok", None
+        except httpx.TimeoutException:
+            return model_name, "timeout", None
         except Exception as e:
             # Clean up error message for brevity
-            err_msg = str(e).split("For more information")[0].strip()
-            if "404" in err_msg:
+            return model_name, "error", str(e).split("For more information")[0].strip()
+
+    # Probes are network-bound, so run them all at once and report as they finish
+    print("\nTesting specific model candidates:")
+    with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+        futures = [executor.submit(probe, name) for name in candidates]
+        for future in as_completed(futures):
+            model_name, status, err_msg = future.result()
+            if status == "ok":
+                print(f"✅ {model_name} is AVAILABLE and WORKING!")
+            elif status == "timeout":
+                timed_out.append(model_name)
+                print(f"❌ {model_name}: Timed out after {PROBE_TIMEOUT}s")
+            elif "404" in err_msg:
                 print(f"❌ {model_name}: Not Found / No Access")
             else:
                 print(f"❌ {model_name}: Error - {err_msg}")
 
 except Exception as e:
     print(f"Fatal error listing models: {e}")
+
+if timed_out:
+    sys.exit(1)
@@ -2,8 +2,11 @@
 """Import contacts from CSV file into the database."""
 
 import csv
+import io
+import itertools
+import queue
+import threading
 import psycopg2
-from psycopg2.extras import execute_values
 import os
 from dotenv import load_dotenv
 
@@ -18,42 +21,75 @@ DB_PASSWORD = os.getenv('DB_PASSWORD')
 
 CSV_FILE = '/Users/tjbarnh/Downloads/Contact List-Grid view.csv'
 
-def import_contacts():
-    # Read CSV
-    contacts = []
-    with open(CSV_FILE, 'r', encoding='utf-8-sig') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            name = row.get('Name', '').strip()
-            if not name:
-                continue
-
-            # Map CSV columns to database columns
-            contact = {
-                'name': name,
-                'title': row.get('Rank', '').strip() or None,  # Rank -> title
-                'department': row.get('Title', '').strip() or None,  # Title -> department (what they oversee)
-                'reports_to': row.get('Reporting to', '').strip() or None,
-                'phone': row.get('Phone', '').strip() or None,
-                'email': row.get('Email', '').strip() or None,
-                'notes': None
-            }
-
-            # Add status and % time to notes if present
-            status = row.get('Status', '').strip()
-            pct_time = row.get('% Time', '').strip()
-            notes_parts = []
-            if status:
-                notes_parts.append(f"Status: {status}")
-            if pct_time:
-                notes_parts.append(f"% Time: {pct_time}")
-            if notes_parts:
-                contact['notes'] = '; '.join(notes_parts)
-
-            contacts.append(contact)
-
-    print(f"Read {len(contacts)} contacts from CSV")
+CONTACT_COLUMNS = 'name, title, department, reports_to, phone, email, notes'
+BATCH_SIZE = 10_000
+# CSV read buffer (the default is 8 KiB)
+READ_BUFFER_SIZE = 1 << 20
+# Parsed batches the reader thread may get ahead of COPY by
+MAX_PENDING_BATCHES = 4
+
+# CSV columns read by iter_contacts, in the order it unpacks them
+CSV_COLUMNS = ['Name', 'Rank', 'Title', 'Reporting to', 'Phone', 'Email', 'Status', '% Time']
+
+def iter_contacts(reader):
+    """Yield a contacts row tuple (in CONTACT_COLUMNS order) for each named CSV row"""
+    # Resolve each CSV column's position once from the header row
+    header = next(reader, [])
+    positions = {column: i for i, column in enumerate(header)}
+    indices = [positions.get(column) for column in CSV_COLUMNS]
+
+    for row in reader:
+        width = len(row)
+        # Blank cells are common, so only strip the ones that have content
+        name, rank, title, reports_to, phone, email, status, pct_time = [
+            (row[i].strip() if row[i] else '') if i is not None and i < width else ''
+            for i in indices
+        ]
+        if not name:
+            continue
+
+        # Add status and % time to notes if present
+        notes_parts = []
+        if status:
+            notes_parts.append(f"Status: {status}")
+        if pct_time:
+            notes_parts.append(f"% Time: {pct_time}")
+
+        # Map CSV columns to database columns: Rank -> title,
+        # Title -> department (what they oversee)
+        yield (
+            name,
+            rank or None,
+            title or None,
+            reports_to or None,
+            phone or None,
+            email or None,
+            '; '.join(notes_parts) or None
+        )
+
+
+def read_batches(batches, errors):
+    """
+    Parse CSV_FILE onto the `batches` queue as (row count, CSV buffer) pairs
+    of up to BATCH_SIZE rows, then put None. A parse failure is appended to
+    `errors` before the None.
+    """
+    try:
+        with open(CSV_FILE, 'r', encoding='utf-8-sig', newline='', buffering=READ_BUFFER_SIZE) as f:
+            contacts = iter_contacts(csv.reader(f))
+            while batch := list(itertools.islice(contacts, BATCH_SIZE)):
+                # None is written as an unquoted empty field, which CSV COPY reads as NULL
+                buf = io.StringIO()
+                csv.writer(buf).writerows(batch)
+                buf.seek(0)
+                batches.put((len(batch), buf))
+    except Exception as e:
+        errors.append(e)
+    finally:
+        batches.put(None)
 
+
+def import_contacts():
     # Connect to database
     conn = psycopg2.connect(
         host=DB_HOST,
@@ -66,19 +102,39 @@ def import_contacts():
     try:
         cursor = conn.cursor()
 
-        # Insert contacts
-        insert_query = """
-            INSERT INTO contacts (name, title, department, reports_to, phone, email, notes)
-            VALUES %s
+        # The import can simply be re-run after a crash, so don't wait on the
+        # WAL flush at commit (applies to this transaction only)
+        cursor.execute("SET LOCAL synchronous_commit = OFF")
+
+        # COPY has no ON CONFLICT, so load a staging table and insert from it
+        cursor.execute(f"""
+            CREATE TEMP TABLE contacts_import ON COMMIT DROP AS
+            SELECT {CONTACT_COLUMNS} FROM contacts WITH NO DATA
+        """)
+
+        # Stream the CSV into the staging table BATCH_SIZE rows at a time, so
+        # memory stays flat however large the file is. A reader thread parses
+        # the next batches while this one waits on COPY.
+        batches = queue.Queue(maxsize=MAX_PENDING_BATCHES)
+        errors = []
+        threading.Thread(target=read_batches, args=(batches, errors), daemon=True).start()
+
+        total = 0
+        while (item := batches.get()) is not None:
+            count, buf = item
+            cursor.copy_expert(f"COPY contacts_import ({CONTACT_COLUMNS}) FROM STDIN WITH (FORMAT csv)", buf)
+            total += count
+        if errors:
+            raise errors[0]
+
+        print(f"Read {total} contacts from CSV")
+
+        # One transaction, so a failed import leaves contacts untouched
+        cursor.execute(f"""
+            INSERT INTO contacts ({CONTACT_COLUMNS})
+            SELECT {CONTACT_COLUMNS} FROM contacts_import
             ON CONFLICT DO NOTHING
-        """
-
-        values = [
-            (c['name'], c['title'], c['department'], c['reports_to'], c['phone'], c['email'], c['notes'])
-            for c in contacts
-        ]
-
-        execute_values(cursor, insert_query, values)
+        """)
         conn.commit()
 
         print(f"Imported {cursor.rowcount} contacts successfully!")
@@ -5,13 +5,19 @@ Coordinates ADK agent with manual fallback routing.
 
 import json
 import logging
+import re
+import threading
 import uuid
 from typing import Optional
 
+from psycopg2.extras import RealDictCursor
+
 from llm_provider import LLMProvider, create_provider
 from manual_router import ManualRouter
 from tools import ALL_TOOLS
-from tools.db import set_db_pool
+from tools.db import get_db_connection, release_db_connection, set_db_pool
+from tools.serialization import from_json, to_json
+from tools.team import get_contacts, log_associate_insight
 
 logger = logging.getLogger(__name__)
 
@@ -149,10 +155,26 @@ Use Smart Brevity format:
 # Mapping of tool names to functions for manual router
 TOOL_FUNCTIONS = {tool.__name__: tool for tool in ALL_TOOLS}
 
+# Task priority (0-3, higher values clamp to Critical) -> label
+PRIORITY_LABELS = ('Low', 'Medium', 'High', 'Critical')
+
 
 class JaxAIOrchestrator:
     """Orchestrates JaxAI responses using ADK agent with fallback"""
 
+    # Template formatter method for each tool's results (see _format_fallback)
+    _FORMATTERS = {
+        'get_summary_stats': '_format_summary_stats',
+        'get_champions': '_format_champions',
+        'get_contacts': '_format_contacts',
+        'get_mentees': '_format_mentees',
+        'get_gold_stars': '_format_gold_stars',
+        'get_tasks': '_format_tasks',
+        'search_visits': '_format_visits',
+        'get_store_information': '_format_store_info',
+        'get_associate_insights': '_format_associate_insights',
+    }
+
     def __init__(self, llm_provider: LLMProvider = None, db_pool=None):
         self.llm_provider = llm_provider or create_provider()
         self.manual_router = ManualRouter()
@@ -355,7 +377,7 @@ class JaxAIOrchestrator:
 
         try:
             tool_result = tool_func(**kwargs)
-            tool_data = json.loads(tool_result)
+            tool_data = from_json(tool_result)
         except Exception as e:
             logger.error(f"Tool execution failed: {e}")
             return {"response": f"Error retrieving data: {e}", "source": "error"}
@@ -385,8 +407,6 @@ class JaxAIOrchestrator:
 
         Returns None if the message doesn't look like contact details (user changed topic).
         """
-        import re
-
         pending = self._pending_insight
         msg = message.strip()
 
@@ -452,10 +472,6 @@ class JaxAIOrchestrator:
         self._pending_insight = None  # Clear state
 
         # Create the contact and get the new contact_id
-        from tools.db import get_db_connection, release_db_connection
-        from psycopg2.extras import RealDictCursor
-        import json as _json
-
         conn = get_db_connection()
         if not conn:
             return {"response": "I couldn't connect to the database to save this contact.", "source": "error"}
@@ -490,7 +506,6 @@ class JaxAIOrchestrator:
 
         # Now log the insight using the contact_id
         if insight_text and contact_id:
-            from tools.team import log_associate_insight
             try:
                 log_associate_insight(contact_id=contact_id, insight=insight_text)
                 return {
@@ -524,7 +539,6 @@ class JaxAIOrchestrator:
         E.g. 'i talked to ibrahim today he said his family is safe'
           -> 'his family is safe'
         """
-        import re
         # Try to extract what comes after "said/mentioned/told me/shared" etc.
         extract_patterns = [
             rf'(?:said|mentioned|told\s+me|shared|informed\s+me)\s+(?:that\s+)?(.+)',
@@ -540,16 +554,13 @@ class JaxAIOrchestrator:
 
     def _handle_insight_by_name(self, name: str, insight: str) -> dict:
         """Look up a contact by name and log the insight, or ask for their details."""
-        from tools.team import get_contacts, log_associate_insight
-        import json as _json
-
         # Extract the meaningful insight text from the full message
         insight = self._extract_insight_text(insight, name)
 
         # Search for the contact by name
         try:
             results_raw = get_contacts(search_term=name)
-            contacts = _json.loads(results_raw)
+            contacts = from_json(results_raw)
         except Exception as e:
             return {"response": f"I had trouble searching your contacts: {e}", "source": "error"}
 
@@ -588,10 +599,7 @@ class JaxAIOrchestrator:
 
     def _handle_create_contact_from_description(self, name: str, title: str, store_number: str) -> dict:
         """Create a new contact from a description like 'Ibrahim is the Store Manager of Store 1951'."""
-        from tools.db import get_db_connection, release_db_connection
-        import json as _json
         try:
-            from psycopg2.extras import RealDictCursor
             conn = get_db_connection()
             if not conn:
                 return {"response": "I couldn't connect to the database to save this contact.", "source": "error"}
@@ -632,16 +640,16 @@ class JaxAIOrchestrator:
 
     def _format_with_llm(self, message: str, data: dict) -> str:
         """Format tool results using LLM"""
-        prompt = f"""{SYSTEM_PROMPT}
-
-User's question: {message}
+        # SYSTEM_PROMPT goes as the system instruction rather than being pasted
+        # into every prompt, and the data as compact JSON (to_json)
+        prompt = f"""User's question: {message}
 
 Data from database:
-{json.dumps(data, indent=2)}
+{to_json(data)}
 
 Please provide a helpful response based on this data."""
 
-        return self.llm_provider.format_response(prompt)
+        return self.llm_provider.format_response(prompt, system_instruction=SYSTEM_PROMPT)
 
     def _format_fallback(self, tool_name: str, data) -> str:
         """Template-based formatting when LLM unavailable"""
@@ -652,80 +660,68 @@ Please provide a helpful response based on this data."""
         if isinstance(data, dict) and 'success' in data:
             return self._format_action_result(data)
 
-        if tool_name == 'get_summary_stats':
-            return self._format_summary_stats(data)
-        elif tool_name == 'get_champions':
-            return self._format_champions(data)
-        elif tool_name == 'get_contacts':
-            return self._format_contacts(data)
-        elif tool_name == 'get_mentees':
-            return self._format_mentees(data)
-        elif tool_name == 'get_gold_stars':
-            return self._format_gold_stars(data)
-        elif tool_name == 'get_tasks':
-            return self._format_tasks(data)
-        elif tool_name == 'search_visits':
-            return self._format_visits(data)
-        elif tool_name == 'get_store_information':
-            return self._format_store_info(data)
-        elif tool_name == 'get_associate_insights':
-            return self._format_associate_insights(data)
+        formatter = self._FORMATTERS.get(tool_name)
+        if formatter:
+            return getattr(self, formatter)(data)
 
         # Default: pretty JSON
-        return f"Here's what I found:\n\n```json\n{json.dumps(data, indent=2)}\n```"
+        return f"Here's what I found:\n\n```json\n{json.dumps(data, indent=2, ensure_ascii=False)}\n```"
 
     def _format_action_result(self, data: dict) -> str:
         """Format action results (create, update, delete operations)"""
         if data.get('success'):
             message = data.get('message', 'Action completed successfully')
-            response = f"✓ **Done!** {message}"
+            parts = [f"✓ **Done!** {message}"]
 
-            # Add details if available
+            # Add details if available (a blank line, then one line per detail)
             if 'contact' in data:
                 c = data['contact']
-                response += f"\n\n**Contact added:**"
-                response += f"\n• Name: {c.get('name', 'N/A')}"
+                parts += ["", "**Contact added:**", f"• Name: {c.get('name', 'N/A')}"]
                 if c.get('title'):
-                    response += f"\n• Title: {c['title']}"
+                    parts.append(f"• Title: {c['title']}")
                 if c.get('department'):
-                    response += f"\n• Department: {c['department']}"
+                    parts.append(f"• Department: {c['department']}")
                 if c.get('phone'):
-                    response += f"\n• Phone: {c['phone']}"
+                    parts.append(f"• Phone: {c['phone']}")
                 if c.get('email'):
-                    response += f"\n• Email: {c['email']}"
+                    parts.append(f"• Email: {c['email']}")
 
             elif 'task' in data:
                 t = data['task']
-                response += f"\n\n**Task details:**"
-                response += f"\n• ID: #{t.get('id', 'N/A')}"
-                response += f"\n• Content: {t.get('content', 'N/A')}"
-                response += f"\n• Status: {t.get('status', 'new')}"
+                parts += [
+                    "",
+                    "**Task details:**",
+                    f"• ID: #{t.get('id', 'N/A')}",
+                    f"• Content: {t.get('content', 'N/A')}",
+                    f"• Status: {t.get('status', 'new')}",
+                ]
                 if t.get('assigned_to'):
-                    response += f"\n• Assigned to: {t['assigned_to']}"
+                    parts.append(f"• Assigned to: {t['assigned_to']}")
                 if t.get('store_number'):
-                    response += f"\n• Store: {t['store_number']}"
+                    parts.append(f"• Store: {t['store_number']}")
 
             elif 'champion' in data:
                 c = data['champion']
-                response += f"\n\n• **{c.get('name', 'N/A')}** - {c.get('responsibility', 'N/A')}"
+                parts += ["", f"• **{c.get('name', 'N/A')}** - {c.get('responsibility', 'N/A')}"]
 
             elif 'mentee' in data:
                 m = data['mentee']
-                response += f"\n\n• **{m.get('name', 'N/A')}**"
+                line = f"• **{m.get('name', 'N/A')}**"
                 if m.get('store_nbr'):
-                    response += f" - Store {m['store_nbr']}"
+                    line += f" - Store {m['store_nbr']}"
                 if m.get('position'):
-                    response += f", {m['position']}"
+                    line += f", {m['position']}"
+                parts += ["", line]
 
             elif 'enabler' in data:
                 e = data['enabler']
-                response += f"\n\n• **{e.get('title', 'N/A')}** ({e.get('status', 'idea')})"
+                parts += ["", f"• **{e.get('title', 'N/A')}** ({e.get('status', 'idea')})"]
 
             elif 'issue' in data:
                 i = data['issue']
-                response += f"\n\n• **{i.get('title', 'N/A')}** (#{i.get('id', 'N/A')}) - {i.get('type', 'issue')}"
+                parts += ["", f"• **{i.get('title', 'N/A')}** (#{i.get('id', 'N/A')}) - {i.get('type', 'issue')}"]
 
-            return response
+            return "\n".join(parts)
         else:
             error = data.get('error', 'Unknown error')
             return f"✗ **Action failed:** {error}"
@@ -859,11 +855,9 @@ Recent activity (30d): {data.get('recent_visits_30d', 0)} visits"""
         if not data:
             return "No tasks found."
 
-        priority_labels = ['Low', 'Medium', 'High', 'Critical']
-
         if len(data) == 1:
             t = data[0]
-            priority = priority_labels[min(t.get('priority', 0), 3)]
+            priority = PRIORITY_LABELS[min(t.get('priority') or 0, 3)]
             status = t.get('status', 'unknown')
             content = t.get('content', 'No content')
             response = f"**[{priority}]** {content} - Status: {status}"
@@ -875,7 +869,7 @@ Recent activity (30d): {data.get('recent_visits_30d', 0)} visits"""
 
         lines = [f"**{len(data)} Tasks:**\n"]
         for t in data:
-            priority = priority_labels[min(t.get('priority', 0), 3)]
+            priority = PRIORITY_LABELS[min(t.get('priority') or 0, 3)]
             status = t.get('status', 'unknown')
             content = t.get('content', 'No content')
             line = f"• **[{priority}]** {content} ({status})"
@@ -974,16 +968,32 @@ Recent activity (30d): {data.get('recent_visits_30d', 0)} visits"""
 
 # Singleton instance for use in main.py
 _orchestrator: Optional[JaxAIOrchestrator] = None
+_orchestrator_lock = threading.Lock()
 
 
 def get_orchestrator(db_pool=None) -> JaxAIOrchestrator:
     """Get or create the JaxAI orchestrator singleton"""
     global _orchestrator
+    # Locked so concurrent first requests build the ADK agent and Runner only once
     if _orchestrator is None:
-        _orchestrator = JaxAIOrchestrator(db_pool=db_pool)
+        with _orchestrator_lock:
+            if _orchestrator is None:
+                _orchestrator = JaxAIOrchestrator(db_pool=db_pool)
     return _orchestrator
 
 
+def warm_up_orchestrator(db_pool=None):
+    """Build the orchestrator (ADK agent, Runner, LLM client) on a background
+    thread so the first chat request doesn't pay for it"""
+    def build():
+        try:
+            get_orchestrator(db_pool)
+        except Exception as e:
+            logger.warning(f"JaxAI warm-up failed: {e}")
+
+    threading.Thread(target=build, name="jax-warmup", daemon=True).start()
+
+
 def process_chat_message(message: str, db_pool=None, session_id: str = None) -> dict:
     """Convenience function to process a chat message"""
     orchestrator = get_orchestrator(db_pool)
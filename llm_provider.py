@@ -17,8 +17,8 @@ class LLMProvider(ABC):
         pass
 
     @abstractmethod
-    def format_response(self, prompt: str) -> str:
-        """Generate a response from the LLM"""
+    def format_response(self, prompt: str, system_instruction: Optional[str] = None) -> str:
+        """Generate a response from the LLM, with an optional system instruction"""
         pass
 
     @abstractmethod
@@ -33,7 +33,10 @@ class GeminiProvider(LLMProvider):
     def __init__(self, project_id: str = None, location: str = None):
         self.project_id = project_id or os.environ.get("GOOGLE_PROJECT_ID")
         self.location = location or os.environ.get("GOOGLE_LOCATION", "us-central1")
+        self.model_name = "gemini-2.5-flash"
         self.model = None
+        # GenerativeModel per system instruction (the instruction is fixed at construction)
+        self._instructed_models = {}
         self._initialize()
 
     def _initialize(self):
@@ -43,7 +46,7 @@ class GeminiProvider(LLMProvider):
             from vertexai.generative_models import GenerativeModel
 
             vertexai.init(project=self.project_id, location=self.location)
-            self.model = GenerativeModel("gemini-2.5-flash")
+            self.model = GenerativeModel(self.model_name)
         except Exception as e:
             print(f"Failed to initialize Gemini: {e}")
             self.model = None
@@ -52,11 +55,18 @@ class GeminiProvider(LLMProvider):
         """Return model string for ADK"""
         return "gemini-2.0-flash"
 
-    def format_response(self, prompt: str) -> str:
+    def format_response(self, prompt: str, system_instruction: Optional[str] = None) -> str:
         """Generate response using Gemini"""
         if not self.model:
             raise RuntimeError("Gemini model not initialized")
-        response = self.model.generate_content(prompt)
+        model = self.model
+        if system_instruction:
+            model = self._instructed_models.get(system_instruction)
+            if model is None:
+                from vertexai.generative_models import GenerativeModel
+                model = GenerativeModel(self.model_name, system_instruction=system_instruction)
+                self._instructed_models[system_instruction] = model
+        response = model.generate_content(prompt)
         return response.text
 
     def is_available(self) -> bool:
@@ -76,13 +86,16 @@ class OllamaProvider(LLMProvider):
         """Return model string for ADK LiteLLM integration"""
         return f"ollama/{self.model_name}"
 
-    def format_response(self, prompt: str) -> str:
+    def format_response(self, prompt: str, system_instruction: Optional[str] = None) -> str:
         """Generate response using Ollama via LiteLLM"""
+        messages = [{"role": "user", "content": prompt}]
+        if system_instruction:
+            messages.insert(0, {"role": "system", "content": system_instruction})
         try:
             import litellm
             response = litellm.completion(
                 model=f"ollama/{self.model_name}",
-                messages=[{"role": "user", "content": prompt}],
+                messages=messages,
                 api_base=self.base_url
             )
             return response.choices[0].message.content
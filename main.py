@@ -21,10 +21,12 @@ else:
 from flask import Flask, request, jsonify, send_from_directory
 import psycopg2
 from psycopg2.extras import RealDictCursor
-from psycopg2.pool import SimpleConnectionPool
+from psycopg2.pool import ThreadedConnectionPool
 from werkzeug.exceptions import BadRequest
 from google.cloud import storage as gcs
 
+from tools.cache import invalidates_tool_caches
+
 app = Flask(__name__)
 
 # --- Configuration ---
@@ -53,7 +55,7 @@ TABLE_NAME = "store_visits"
 
 # Initialize PostgreSQL connection pool with keepalive settings for unstable networks
 try:
-    db_pool = SimpleConnectionPool(
+    db_pool = ThreadedConnectionPool(
         1, 20,
         host=DB_HOST,
         port=DB_PORT,
@@ -615,6 +617,7 @@ Extract and return as JSON:
             }), 500
 
 @app.route('/api/save-visit', methods=['POST'])
+@invalidates_tool_caches
 def save_visit():
     if not db_pool:
         return jsonify({"error": "Database not connected"}), 500
@@ -774,6 +777,7 @@ def check_duplicate():
 
 
 @app.route('/api/visits/<int:visit_id>/notes-received', methods=['POST'])
+@invalidates_tool_caches
 def toggle_notes_received(visit_id):
     """Toggle the notes_received status for a visit"""
     conn = get_db_connection()
@@ -808,6 +812,7 @@ def toggle_notes_received(visit_id):
 
 
 @app.route('/api/notes/<note_type>/<int:note_id>', methods=['DELETE'])
+@invalidates_tool_caches
 def delete_note(note_type, note_id):
     """Delete a specific note by type and ID"""
     # Map note types to table names
@@ -848,6 +853,7 @@ def delete_note(note_type, note_id):
 
 
 @app.route('/api/notes/<note_type>/<int:note_id>', methods=['PUT'])
+@invalidates_tool_caches
 def edit_note(note_type, note_id):
     """Edit a specific note's text by type and ID"""
     # Map note types to table names
@@ -894,6 +900,7 @@ def edit_note(note_type, note_id):
 
 
 @app.route('/api/visits/<int:visit_id>', methods=['PUT'])
+@invalidates_tool_caches
 def update_visit(visit_id):
     """Update visit details (date, rating, store number)"""
     conn = get_db_connection()
@@ -944,6 +951,7 @@ def update_visit(visit_id):
 
 
 @app.route('/api/visits/<int:visit_id>/notes', methods=['POST'])
+@invalidates_tool_caches
 def add_note_to_visit(visit_id):
     """Add a new note to an existing visit"""
     conn = get_db_connection()
@@ -999,6 +1007,7 @@ def add_note_to_visit(visit_id):
 
 
 @app.route('/api/visits/<int:visit_id>', methods=['DELETE'])
+@invalidates_tool_caches
 def delete_visit(visit_id):
     """Delete an entire visit and all its associated notes"""
     conn = get_db_connection()
@@ -1223,6 +1232,7 @@ def get_market_notes():
 
 
 @app.route('/api/market-notes/update', methods=['POST'])
+@invalidates_tool_caches
 def update_market_note():
     """Update a market note's status, assignment, or completion"""
     if not db_pool:
@@ -1303,6 +1313,7 @@ def update_market_note():
 
 
 @app.route('/api/market-notes/rename', methods=['POST'])
+@invalidates_tool_caches
 def rename_market_note():
     """Rename/edit a market note's text"""
     if not db_pool:
@@ -1359,6 +1370,7 @@ def rename_market_note():
 
 
 @app.route('/api/market-notes/assign-store', methods=['POST'])
+@invalidates_tool_caches
 def assign_store_to_market_note():
     """Assign a store number to market notes from a visit with missing/invalid store"""
     if not db_pool:
@@ -1406,6 +1418,7 @@ def assign_store_to_market_note():
 
 
 @app.route('/api/market-notes/add-update', methods=['POST'])
+@invalidates_tool_caches
 def add_market_note_update():
     """Add an update/comment to a market note"""
     if not db_pool:
@@ -1460,6 +1473,7 @@ def add_market_note_update():
 
 
 @app.route('/api/market-notes/delete-update/<int:update_id>', methods=['DELETE'])
+@invalidates_tool_caches
 def delete_market_note_update(update_id):
     """Delete an update/comment from a market note"""
     if not db_pool:
@@ -1490,6 +1504,7 @@ def delete_market_note_update(update_id):
 
 
 @app.route('/api/market-notes/edit-update/<int:update_id>', methods=['PUT'])
+@invalidates_tool_caches
 def edit_market_note_update(update_id):
     """Edit an update/comment on a market note"""
     if not db_pool:
@@ -1540,6 +1555,7 @@ def edit_market_note_update(update_id):
 
 
 @app.route('/api/market-notes/toggle', methods=['POST'])
+@invalidates_tool_caches
 def toggle_market_note():
     """Toggle the completion status of a market note (legacy endpoint)"""
     if not db_pool:
@@ -1797,6 +1813,7 @@ def get_current_gold_stars():
 
 
 @app.route('/api/gold-stars/week', methods=['POST'])
+@invalidates_tool_caches
 def save_gold_star_week():
     """Create or update the current week's gold star notes"""
     conn = get_db_connection()
@@ -1839,6 +1856,7 @@ def save_gold_star_week():
 
 
 @app.route('/api/gold-stars/toggle', methods=['POST'])
+@invalidates_tool_caches
 def toggle_gold_star_completion():
     """Toggle a store's completion status for a gold star note (works for any week)"""
     conn = get_db_connection()
@@ -1963,6 +1981,7 @@ def get_champions():
 
 
 @app.route('/api/champions', methods=['POST'])
+@invalidates_tool_caches
 def add_champion():
     """Add a new champion"""
     conn = get_db_connection()
@@ -2007,6 +2026,7 @@ def add_champion():
 
 
 @app.route('/api/champions/<int:champion_id>', methods=['PUT'])
+@invalidates_tool_caches
 def update_champion(champion_id):
     """Update a champion"""
     conn = get_db_connection()
@@ -2045,6 +2065,7 @@ def update_champion(champion_id):
 
 
 @app.route('/api/champions/<int:champion_id>', methods=['DELETE'])
+@invalidates_tool_caches
 def delete_champion(champion_id):
     """Delete a champion"""
     conn = get_db_connection()
@@ -4067,6 +4088,7 @@ def get_mentees():
 
 
 @app.route('/api/mentees', methods=['POST'])
+@invalidates_tool_caches
 def add_mentee():
     """Add a new mentee"""
     conn = get_db_connection()
@@ -4117,6 +4139,7 @@ def add_mentee():
 
 
 @app.route('/api/mentees/<int:mentee_id>', methods=['PUT'])
+@invalidates_tool_caches
 def update_mentee(mentee_id):
     """Update a mentee"""
     conn = get_db_connection()
@@ -4158,6 +4181,7 @@ def update_mentee(mentee_id):
 
 
 @app.route('/api/mentees/<int:mentee_id>', methods=['DELETE'])
+@invalidates_tool_caches
 def delete_mentee(mentee_id):
     """Delete a mentee"""
     conn = get_db_connection()
@@ -5369,6 +5393,7 @@ def get_store_info_detail(store_number):
 
 
 @app.route('/api/store-info', methods=['POST'])
+@invalidates_tool_caches
 def create_store_info():
     """Create a new store info record"""
     ensure_store_info_table()
@@ -5425,6 +5450,7 @@ def create_store_info():
 
 
 @app.route('/api/store-info/<store_number>', methods=['PUT'])
+@invalidates_tool_caches
 def upsert_store_info(store_number):
     """Upsert store info — update if exists, create if not"""
     ensure_store_info_table()
@@ -5521,6 +5547,16 @@ with app.app_context():
     except Exception as e:
         print(f"Warning: startup DB migration failed: {e}")
 
+# Opt-in (JAX_WARMUP=1): build the JaxAI orchestrator in the background so the
+# first chat isn't slow. Runs in every process that imports main (each gunicorn
+# worker, the debug reloader, scripts), so it is off by default.
+if os.environ.get("JAX_WARMUP") == "1":
+    try:
+        from jax_agent import warm_up_orchestrator
+        warm_up_orchestrator(db_pool)
+    except Exception as e:
+        print(f"Warning: JaxAI warm-up failed to start: {e}")
+
 
 if __name__ == "__main__":
     app.run(debug=True, host="0.0.0.0", port=int(os.environ.get("PORT", 8080)))
@@ -6,6 +6,23 @@ Extracted from main.py chat() function for use when LLM is unavailable.
 import re
 from typing import Tuple, Dict, Any, Optional
 
+# Conversational phrases about talking to someone, compiled once. Checked in
+# order before any other routing, so the first pattern that names a person wins.
+INSIGHT_TRIGGER_PATTERNS = [re.compile(p) for p in (
+    r'i\s+(?:talked|spoke|chatted|met|visited|caught up)\s+(?:to|with)\s+(\w+)',
+    r'i\s+spent\s+(?:some\s+)?time\s+with\s+(\w+)',
+    r'i\s+(?:ran|bumped)\s+into\s+(\w+)',
+    r'i\s+was\s+with\s+(\w+)',
+    r'i\s+had\s+a\s+(?:call|chat|meeting|conversation)\s+with\s+(\w+)',
+    r'(\w+)\s+(?:told|said|mentioned|shared|informed)\s+(?:me|us)',
+    r'(\w+)\s+said\s+that',
+    r'caught\s+up\s+with\s+(\w+)',
+    r'had\s+a\s+conversation\s+with\s+(\w+)',
+)]
+
+# Words an insight trigger can capture that aren't names
+INSIGHT_SKIP_WORDS = frozenset({'a', 'the', 'my', 'our', 'his', 'her', 'their', 'me', 'us', 'him', 'them', 'store'})
+
 
 class ManualRouter:
     """Regex-based routing fallback when LLM unavailable"""
@@ -46,24 +63,12 @@ class ManualRouter:
     # ============ ⚠️ RULE #1 — HIGHEST PRIORITY: ASSOCIATE INSIGHT DETECTION ============
         # Check BEFORE any other routing. Conversational phrases about interacting with someone
         # should ALWAYS be treated as associate insight logging, never as a store visit query.
-        insight_trigger_patterns = [
-            r'i\s+(?:talked|spoke|chatted|met|visited|caught up)\s+(?:to|with)\s+(\w+)',
-            r'i\s+spent\s+(?:some\s+)?time\s+with\s+(\w+)',
-            r'i\s+(?:ran|bumped)\s+into\s+(\w+)',
-            r'i\s+was\s+with\s+(\w+)',
-            r'i\s+had\s+a\s+(?:call|chat|meeting|conversation)\s+with\s+(\w+)',
-            r'(\w+)\s+(?:told|said|mentioned|shared|informed)\s+(?:me|us)',
-            r'(\w+)\s+said\s+that',
-            r'caught\s+up\s+with\s+(\w+)',
-            r'had\s+a\s+conversation\s+with\s+(\w+)',
-        ]
-        for pattern in insight_trigger_patterns:
-            m = re.search(pattern, message_lower)
+        for pattern in INSIGHT_TRIGGER_PATTERNS:
+            m = pattern.search(message_lower)
             if m:
                 person_name = m.group(1).strip()
                 # Skip common words that aren't names
-                skip_words = {'a', 'the', 'my', 'our', 'his', 'her', 'their', 'me', 'us', 'him', 'them', 'store', 'him', 'her'}
-                if person_name not in skip_words:
+                if person_name not in INSIGHT_SKIP_WORDS:
                     return 'log_associate_insight_by_name', {'name': person_name, 'insight': message}
 
         # ============ CONTACT CREATION FROM DESCRIPTION ============
@@ -0,0 +1,15 @@
+-- Migration 022: Trigram indexes for note keyword search
+-- Lets search_notes' `note_text ILIKE '%keyword%'` use an index instead of
+-- sequentially scanning every note table.
+-- No BEGIN/COMMIT: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_visit_notes_trgm
+    ON store_visit_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_notes_trgm
+    ON store_market_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_good_notes_trgm
+    ON store_good_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_improvement_notes_trgm
+    ON store_improvement_notes USING GIN (note_text gin_trgm_ops);
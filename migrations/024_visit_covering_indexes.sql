@@ -0,0 +1,19 @@
+-- Migration 024: Covering indexes for per-store visit lookups and note fetches
+-- ("storeNbr", calendar_date DESC) INCLUDE (rating) lets search_visits'
+-- ORDER BY calendar_date DESC LIMIT n stop after n index entries with no sort,
+-- and (visit_id, sequence) returns each visit's notes already ordered.
+-- No BEGIN/COMMIT: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sv_store_date_desc
+    ON store_visits ("storeNbr", calendar_date DESC) INCLUDE (rating);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_visit_notes_visit_seq
+    ON store_visit_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_notes_visit_seq
+    ON store_market_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_good_notes_visit_seq
+    ON store_good_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_improvement_notes_visit_seq
+    ON store_improvement_notes (visit_id, sequence);
+
+ANALYZE store_visits;
@@ -0,0 +1,10 @@
+-- Migration 025: Trigram index for market note update lookups
+-- Lets get_market_note_updates' `note_text ILIKE '%text%'` use an index
+-- instead of scanning market_note_updates (the B-tree from 007 only helps
+-- exact matches).
+-- No BEGIN/COMMIT: CREATE INDEX CONCURRENTLY cannot run inside a transaction.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_note_updates_trgm
+    ON market_note_updates USING GIN (note_text gin_trgm_ops);
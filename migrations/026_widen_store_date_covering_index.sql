@@ -0,0 +1,16 @@
+-- Migration 026: Widen the per-store covering index for compare_stores
+-- compare_stores aggregates rating, sales_comp_wtd, vizpick, ftpr and
+-- calendar_date per store; carrying those columns in the index lets it run
+-- as an Index Only Scan (Heap Fetches: 0 once the table is vacuumed).
+-- Replaces idx_sv_store_date_desc from migration 024, which it covers.
+-- No BEGIN/COMMIT: CREATE/DROP INDEX CONCURRENTLY and VACUUM cannot run
+-- inside a transaction.
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sv_store_date_covering
+    ON store_visits ("storeNbr", calendar_date DESC)
+    INCLUDE (rating, sales_comp_wtd, vizpick, ftpr);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_sv_store_date_desc;
+
+-- Sets the visibility map so index-only scans can skip the heap
+VACUUM ANALYZE store_visits;
@@ -0,0 +1,17 @@
+#!/bin/bash
+# Refresh store_visit_daily_rollup (migration 023) for the JaxAI trend/summary tools
+# Run on the Proxmox server from the store-visit-rollup systemd timer (see README.md)
+
+# Nothing to refresh until migration 023 has been applied; the tools fall
+# back to aggregating store_visits directly in the meantime
+EXISTS=$(sudo -u postgres psql -d store_visits -tAc "SELECT to_regclass('store_visit_daily_rollup') IS NOT NULL")
+if [ "$EXISTS" != "t" ]; then
+    echo "store_visit_daily_rollup not found; skipping refresh"
+    exit 0
+fi
+
+# CONCURRENTLY keeps the view readable while it rebuilds (can't run in a transaction block)
+sudo -u postgres psql -d store_visits -v ON_ERROR_STOP=1 \
+    -c "REFRESH MATERIALIZED VIEW CONCURRENTLY store_visit_daily_rollup"
+
+echo "store_visit_daily_rollup refreshed"
@@ -0,0 +1,19 @@
+#!/bin/bash
+# Run migration 022: Trigram indexes for note keyword search
+# Usage: Copy to Proxmox server and run: chmod +x run_022.sh && ./run_022.sh
+# (pg_trgm needs superuser to install, hence postgres)
+
+sudo -u postgres psql -d store_visits <<'SQL'
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_visit_notes_trgm
+    ON store_visit_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_notes_trgm
+    ON store_market_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_good_notes_trgm
+    ON store_good_notes USING GIN (note_text gin_trgm_ops);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_improvement_notes_trgm
+    ON store_improvement_notes USING GIN (note_text gin_trgm_ops);
+SQL
+
+echo "Migration 022 complete!"
@@ -0,0 +1,33 @@
+#!/bin/bash
+# Run migration 023: Daily visit rollup for JaxAI trend/summary tools
+# Usage: Copy to Proxmox server and run: chmod +x run_023.sh && ./run_023.sh
+
+sudo -u postgres psql -d store_visits <<'SQL'
+BEGIN;
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS store_visit_daily_rollup AS
+SELECT
+    "storeNbr",
+    calendar_date,
+    rating,
+    COUNT(*) AS visit_count,
+    SUM(sales_comp_yest) AS sales_comp_yest_sum, COUNT(sales_comp_yest) AS sales_comp_yest_n,
+    SUM(sales_comp_wtd) AS sales_comp_wtd_sum, COUNT(sales_comp_wtd) AS sales_comp_wtd_n,
+    SUM(sales_comp_mtd) AS sales_comp_mtd_sum, COUNT(sales_comp_mtd) AS sales_comp_mtd_n,
+    SUM(vizpick) AS vizpick_sum, COUNT(vizpick) AS vizpick_n,
+    SUM(ftpr) AS ftpr_sum, COUNT(ftpr) AS ftpr_n,
+    SUM(overstock)::numeric AS overstock_sum, COUNT(overstock) AS overstock_n
+FROM store_visits
+GROUP BY "storeNbr", calendar_date, rating;
+
+-- Required for REFRESH ... CONCURRENTLY
+CREATE UNIQUE INDEX IF NOT EXISTS idx_daily_rollup_store_date_rating
+    ON store_visit_daily_rollup ("storeNbr", calendar_date, rating);
+
+-- The app only reads the view; refresh_daily_rollup.sh refreshes it as postgres
+GRANT SELECT ON store_visit_daily_rollup TO store_tracker;
+
+COMMIT;
+SQL
+
+echo "Migration 023 complete!"
@@ -0,0 +1,23 @@
+#!/bin/bash
+# Run migration 024: Covering indexes for per-store visit lookups and note fetches
+# Usage: Copy to Proxmox server and run: chmod +x run_024.sh && ./run_024.sh
+# Check afterwards with EXPLAIN (ANALYZE, BUFFERS) on search_visits' query:
+# the plan should be a Limit over an Index Scan on idx_sv_store_date_desc, with no Sort.
+
+sudo -u postgres psql -d store_visits <<'SQL'
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sv_store_date_desc
+    ON store_visits ("storeNbr", calendar_date DESC) INCLUDE (rating);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_visit_notes_visit_seq
+    ON store_visit_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_notes_visit_seq
+    ON store_market_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_good_notes_visit_seq
+    ON store_good_notes (visit_id, sequence);
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_improvement_notes_visit_seq
+    ON store_improvement_notes (visit_id, sequence);
+
+ANALYZE store_visits;
+SQL
+
+echo "Migration 024 complete!"
@@ -0,0 +1,13 @@
+#!/bin/bash
+# Run migration 025: Trigram index for market note update lookups
+# Usage: Copy to Proxmox server and run: chmod +x run_025.sh && ./run_025.sh
+# (pg_trgm needs superuser to install, hence postgres)
+
+sudo -u postgres psql -d store_visits <<'SQL'
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_market_note_updates_trgm
+    ON market_note_updates USING GIN (note_text gin_trgm_ops);
+SQL
+
+echo "Migration 025 complete!"
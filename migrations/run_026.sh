@@ -0,0 +1,17 @@
+#!/bin/bash
+# Run migration 026: Widen the per-store covering index for compare_stores
+# Usage: Copy to Proxmox server and run: chmod +x run_026.sh && ./run_026.sh
+# Check afterwards with EXPLAIN (ANALYZE, BUFFERS) on compare_stores' query:
+# expect an Index Only Scan on idx_sv_store_date_covering with Heap Fetches: 0.
+
+sudo -u postgres psql -d store_visits <<'SQL'
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_sv_store_date_covering
+    ON store_visits ("storeNbr", calendar_date DESC)
+    INCLUDE (rating, sales_comp_wtd, vizpick, ftpr);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_sv_store_date_desc;
+
+VACUUM ANALYZE store_visits;
+SQL
+
+echo "Migration 026 complete!"
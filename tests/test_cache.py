@@ -0,0 +1,95 @@
+"""Tests for tools.cache.ttl_cache and clear_tool_caches."""
+
+import os
+import tempfile
+import time
+import unittest
+
+import tools.cache as cache
+from tools.cache import clear_tool_caches, ttl_cache
+
+
+class TtlCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        # Private stamp file, re-read on every call
+        fd, self.stamp_path = tempfile.mkstemp()
+        os.close(fd)
+        os.remove(self.stamp_path)
+        self._saved = (cache.CACHE_STAMP_PATH, cache.STAMP_CHECK_INTERVAL, cache._stamp)
+        cache.CACHE_STAMP_PATH = self.stamp_path
+        cache.STAMP_CHECK_INTERVAL = 0
+        cache._stamp = (float('-inf'), 0)
+
+    def tearDown(self):
+        cache.CACHE_STAMP_PATH, cache.STAMP_CHECK_INTERVAL, cache._stamp = self._saved
+        if os.path.exists(self.stamp_path):
+            os.remove(self.stamp_path)
+
+    def test_hit_then_expiry(self):
+        calls = []
+
+        @ttl_cache(ttl=0.2)
+        def tool(x):
+            calls.append(x)
+            return f"result {len(calls)}"
+
+        self.assertEqual(tool(1), "result 1")
+        self.assertEqual(tool(1), "result 1")
+        self.assertEqual(tool(2), "result 2")
+        self.assertEqual(len(calls), 2)
+
+        time.sleep(0.25)
+        self.assertEqual(tool(1), "result 3")
+
+    def test_clear_drops_in_flight_result(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def tool():
+            calls.append(1)
+            if len(calls) == 1:
+                # A write lands while the first computation is running
+                clear_tool_caches()
+            return f"result {len(calls)}"
+
+        self.assertEqual(tool(), "result 1")
+        # The pre-write result wasn't stored
+        self.assertEqual(tool(), "result 2")
+        self.assertEqual(tool(), "result 2")
+
+    def test_clear_from_another_process(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def tool():
+            calls.append(1)
+            return f"result {len(calls)}"
+
+        self.assertEqual(tool(), "result 1")
+        # What another worker's clear_tool_caches() leaves behind
+        now = time.time_ns()
+        with open(self.stamp_path, 'a'):
+            pass
+        os.utime(self.stamp_path, ns=(now, now))
+        self.assertEqual(tool(), "result 2")
+
+    def test_exceptions_are_not_cached(self):
+        calls = []
+
+        @ttl_cache(ttl=60)
+        def tool():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("database unavailable")
+            return "ok"
+
+        with self.assertRaises(RuntimeError):
+            tool()
+        self.assertEqual(tool(), "ok")
+        self.assertEqual(tool(), "ok")
+        self.assertEqual(len(calls), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+"""Tests for tools.fiscal against the original timedelta-based implementation."""
+
+import unittest
+from datetime import date, timedelta
+from unittest import mock
+
+import tools.fiscal as fiscal
+
+
+def reference_fiscal_week_number(week_start_date):
+    year = week_start_date.year
+    fiscal_year_start = date(year, 1, 31)
+    if week_start_date < fiscal_year_start:
+        fiscal_year_start = date(year - 1, 1, 31)
+    days_to_saturday = (5 - fiscal_year_start.weekday()) % 7
+    first_saturday = fiscal_year_start + timedelta(days=days_to_saturday)
+    return ((week_start_date - first_saturday).days // 7) + 1
+
+
+def reference_monday_from_fiscal_week(week_number, year, today):
+    fiscal_year_start = date(year, 1, 31)
+    if today < fiscal_year_start and week_number > 40:
+        fiscal_year_start = date(year - 1, 1, 31)
+    days_to_saturday = (5 - fiscal_year_start.weekday()) % 7
+    first_saturday = fiscal_year_start + timedelta(days=days_to_saturday)
+    return first_saturday + timedelta(weeks=week_number - 1) + timedelta(days=2)
+
+
+def fake_today(today):
+    """A date class whose today() is `today`, to patch into tools.fiscal"""
+    class FakeDate(date):
+        @classmethod
+        def today(cls):
+            return today
+    return FakeDate
+
+
+class FiscalTest(unittest.TestCase):
+
+    def test_fiscal_week_number_around_year_boundaries(self):
+        for year in range(2019, 2031):
+            # Late December through mid-February covers both the calendar
+            # and the fiscal year boundary
+            start = date(year - 1, 12, 20)
+            for offset in range(60):
+                day = start + timedelta(days=offset)
+                with self.subTest(day=day):
+                    self.assertEqual(fiscal.get_fiscal_week_number(day),
+                                     reference_fiscal_week_number(day))
+
+    def test_monday_from_fiscal_week_around_year_boundaries(self):
+        for year in range(2019, 2031):
+            for today in (date(year, 1, 1), date(year, 1, 30), date(year, 1, 31),
+                          date(year, 2, 1), date(year, 12, 31)):
+                for week_number in (1, 2, 40, 41, 52, 53):
+                    with self.subTest(today=today, week=week_number):
+                        with mock.patch.object(fiscal, "date", fake_today(today)):
+                            self.assertEqual(
+                                fiscal.get_monday_from_fiscal_week(week_number, year),
+                                reference_monday_from_fiscal_week(week_number, year, today))
+                            # year defaults to the current year
+                            self.assertEqual(
+                                fiscal.get_monday_from_fiscal_week(week_number),
+                                reference_monday_from_fiscal_week(week_number, today.year, today))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+"""Tests for tools.serialization.to_json / from_json."""
+
+import json
+import unittest
+from dataclasses import dataclass
+from datetime import date, datetime
+from decimal import Decimal
+from unittest import mock
+
+import tools.serialization as serialization
+from tools.serialization import from_json, to_json
+
+
+@dataclass(slots=True)
+class Row:
+    name: str
+    visited: date
+
+
+VALUE = {
+    "avg": Decimal("1.25"),
+    "day": date(2025, 1, 31),
+    "at": datetime(2025, 1, 31, 8, 30, 15),
+    "row": Row("Store 1234", date(2025, 2, 1)),
+    "by_week": {1: "first", 2: "second"},
+}
+
+EXPECTED = {
+    "avg": 1.25,
+    "day": "2025-01-31",
+    "at": "2025-01-31T08:30:15",
+    "row": {"name": "Store 1234", "visited": "2025-02-01"},
+    "by_week": {"1": "first", "2": "second"},
+}
+
+
+class ToJsonTest(unittest.TestCase):
+
+    @unittest.skipIf(serialization.orjson is None, "orjson not installed")
+    def test_orjson(self):
+        self.assertEqual(json.loads(to_json(VALUE)), EXPECTED)
+        self.assertEqual(from_json(to_json(VALUE)), EXPECTED)
+
+    def test_stdlib_fallback(self):
+        with mock.patch.object(serialization, "orjson", None):
+            self.assertEqual(json.loads(to_json(VALUE)), EXPECTED)
+            self.assertEqual(from_json(to_json(VALUE)), EXPECTED)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,165 @@
+"""
+In-process result caching for read-only JaxAI tools.
+"""
+
+import functools
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+
+logger = logging.getLogger(__name__)
+
+# cache_clear callbacks for every cached tool, used by clear_tool_caches()
+_cache_clearers = []
+
+# Touched by clear_tool_caches() so every gunicorn worker on this host drops
+# its cached results, not just the worker that handled the write
+CACHE_STAMP_PATH = os.environ.get(
+    "JAX_CACHE_STAMP", os.path.join(tempfile.gettempdir(), "jaxai_tool_cache.stamp")
+)
+
+# Seconds between checks of CACHE_STAMP_PATH, so cache hits rarely stat it
+STAMP_CHECK_INTERVAL = 1.0
+
+# (time.monotonic() of the last check, stamp seen then)
+_stamp = (float('-inf'), 0)
+
+
+def _cache_stamp():
+    """
+    Modification time (ns) of the shared invalidation stamp, 0 if never
+    touched. Re-read at most every STAMP_CHECK_INTERVAL seconds, so other
+    processes' clears are seen within that interval.
+    """
+    global _stamp
+    now = time.monotonic()
+    checked_at, stamp = _stamp
+    if now - checked_at >= STAMP_CHECK_INTERVAL:
+        try:
+            stamp = os.stat(CACHE_STAMP_PATH).st_mtime_ns
+        except OSError:
+            stamp = 0
+        _stamp = (now, stamp)
+    return stamp
+
+
+def ttl_cache(ttl: int = 300, maxsize: int = 256, stale_ttl: int = 0):
+    """
+    Cache a tool's JSON result per argument set for `ttl` seconds.
+
+    Entries are keyed on today's date as well as the arguments, since tools
+    compute their windows from date.today(). Entries are evicted
+    least-recently-used once `maxsize` is reached. Tool results are JSON
+    strings, so cached values are safe to share.
+
+    With `stale_ttl` > `ttl`, an entry older than `ttl` but younger than
+    `stale_ttl` is still returned while a single background thread
+    recomputes it (stale-while-revalidate).
+
+    Entries are dropped whenever clear_tool_caches() runs in any process on
+    this host (within STAMP_CHECK_INTERVAL for other processes); `ttl`
+    bounds staleness for writes made anywhere else.
+    """
+    def decorator(func):
+        entries = OrderedDict()
+        refreshing = set()
+        lock = threading.Lock()
+        # Bumped by cache_clear so in-flight computations don't store stale results
+        generation = [0]
+        # CACHE_STAMP_PATH mtime the entries were cached under
+        seen_stamp = [_cache_stamp()]
+
+        def store(key, result, now, gen):
+            with lock:
+                if gen != generation[0]:
+                    return
+                entries[key] = (now, result)
+                entries.move_to_end(key)
+                while len(entries) > maxsize:
+                    entries.popitem(last=False)
+
+        def refresh(key, args, kwargs, gen):
+            try:
+                store(key, func(*args, **kwargs), time.monotonic(), gen)
+            except Exception as e:
+                logger.warning(f"Background refresh of {func.__name__} failed: {e}")
+            finally:
+                with lock:
+                    refreshing.discard(key)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (date.today(), args, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            stamp = _cache_stamp()
+            with lock:
+                if stamp != seen_stamp[0]:
+                    # Another process cleared the tool caches
+                    seen_stamp[0] = stamp
+                    generation[0] += 1
+                    entries.clear()
+                gen = generation[0]
+                entry = entries.get(key)
+                if entry:
+                    age = now - entry[0]
+                    if age < ttl:
+                        entries.move_to_end(key)
+                        return entry[1]
+                    if age < stale_ttl:
+                        if key not in refreshing:
+                            refreshing.add(key)
+                            threading.Thread(target=refresh, args=(key, args, kwargs, gen),
+                                             daemon=True).start()
+                        return entry[1]
+
+            result = func(*args, **kwargs)
+            store(key, result, now, gen)
+            return result
+
+        def cache_clear():
+            with lock:
+                generation[0] += 1
+                entries.clear()
+                # Cleared up to the current stamp, so the wrapper needn't clear again
+                seen_stamp[0] = _stamp[1]
+
+        wrapper.cache_clear = cache_clear
+        _cache_clearers.append(cache_clear)
+        return wrapper
+    return decorator
+
+
+def clear_tool_caches():
+    """Drop every cached tool result, in this and every other local process
+    (call after writes to data the tools read)"""
+    global _stamp
+    try:
+        with open(CACHE_STAMP_PATH, 'a'):
+            pass
+        # Explicit ns timestamp, since the filesystem clock can be too coarse
+        # to tell two clears apart
+        now = time.time_ns()
+        os.utime(CACHE_STAMP_PATH, ns=(now, now))
+        _stamp = (time.monotonic(), now)
+    except OSError as e:
+        logger.warning(f"Could not touch tool cache stamp {CACHE_STAMP_PATH}: {e}")
+    for cache_clear in _cache_clearers:
+        cache_clear()
+
+
+def invalidates_tool_caches(func):
+    """
+    Mark a write: cached tool results are dropped after it runs. Used on the
+    write tools and on main.py's routes that change data the cached tools read.
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        try:
+            return func(*args, **kwargs)
+        finally:
+            clear_tool_caches()
+    return wrapper
@@ -2,10 +2,56 @@
 Database connection utilities for JaxAI tools.
 """
 
+import atexit
 import os
+import threading
+import weakref
+
+import psycopg2
+from psycopg2.pool import ThreadedConnectionPool
 
 # Global reference to db_pool from main.py - set during app initialization
 _db_pool = None
+_db_pool_lock = threading.Lock()
+
+# Names of the statements already PREPAREd on each connection
+_prepared_statements = weakref.WeakKeyDictionary()
+
+# Set once store_visit_daily_rollup has been seen to exist
+_daily_rollup_exists = False
+
+# Columns of the store_visit_daily_rollup view
+# (migrations/023_store_visit_daily_rollup.sql), aggregated from store_visits
+_DAILY_ROLLUP_COLUMNS = """
+        "storeNbr",
+        calendar_date,
+        rating,
+        COUNT(*) AS visit_count,
+        SUM(sales_comp_yest) AS sales_comp_yest_sum, COUNT(sales_comp_yest) AS sales_comp_yest_n,
+        SUM(sales_comp_wtd) AS sales_comp_wtd_sum, COUNT(sales_comp_wtd) AS sales_comp_wtd_n,
+        SUM(sales_comp_mtd) AS sales_comp_mtd_sum, COUNT(sales_comp_mtd) AS sales_comp_mtd_n,
+        SUM(vizpick) AS vizpick_sum, COUNT(vizpick) AS vizpick_n,
+        SUM(ftpr) AS ftpr_sum, COUNT(ftpr) AS ftpr_n,
+        SUM(overstock)::numeric AS overstock_sum, COUNT(overstock) AS overstock_n
+"""
+
+# Same shape as the store_visit_daily_rollup view, computed on the fly
+DAILY_ROLLUP_SELECT = f"""
+    SELECT {_DAILY_ROLLUP_COLUMNS}
+    FROM store_visits
+    GROUP BY "storeNbr", calendar_date, rating
+"""
+
+# The view for past days plus today's visits straight from store_visits, since
+# the view is only refreshed periodically (migrations/refresh_daily_rollup.sh)
+DAILY_ROLLUP_WITH_TODAY_SELECT = f"""
+    SELECT * FROM store_visit_daily_rollup WHERE calendar_date < CURRENT_DATE
+    UNION ALL
+    SELECT {_DAILY_ROLLUP_COLUMNS}
+    FROM store_visits
+    WHERE calendar_date >= CURRENT_DATE
+    GROUP BY "storeNbr", calendar_date, rating
+"""
 
 
 def set_db_pool(pool):
@@ -14,27 +60,52 @@ def set_db_pool(pool):
     _db_pool = pool
 
 
+def _connect_params():
+    """Connection settings shared by the pool and the direct fallback"""
+    return dict(
+        host=os.environ.get("DB_HOST", "localhost"),
+        port=os.environ.get("DB_PORT", "5432"),
+        database=os.environ.get("DB_NAME", "store_visits"),
+        user=os.environ.get("DB_USER", "store_tracker"),
+        password=os.environ.get("DB_PASSWORD"),
+        # Same timeout/keepalive settings as main.py's pool, so idle pooled
+        # connections survive the unstable link instead of being reopened
+        connect_timeout=10,
+        keepalives=1,
+        keepalives_idle=30,
+        keepalives_interval=10,
+        keepalives_count=5
+    )
+
+
+def _get_pool():
+    """Return the shared pool, creating our own on first use if main.py didn't set one"""
+    global _db_pool
+    if _db_pool is None:
+        with _db_pool_lock:
+            if _db_pool is None:
+                try:
+                    _db_pool = ThreadedConnectionPool(2, 10, **_connect_params())
+                    atexit.register(_db_pool.closeall)
+                except Exception:
+                    return None
+    return _db_pool
+
+
 def get_db_connection():
     """Get database connection from the pool or create direct connection as fallback"""
-    global _db_pool
+    pool = _get_pool()
 
     # Try to use the shared pool first
-    if _db_pool is not None:
+    if pool is not None:
         try:
-            conn = _db_pool.getconn()
+            conn = pool.getconn()
             return conn
         except Exception:
             pass
 
     # Fallback to direct connection
-    import psycopg2
-    conn = psycopg2.connect(
-        host=os.environ.get("DB_HOST", "localhost"),
-        port=os.environ.get("DB_PORT", "5432"),
-        database=os.environ.get("DB_NAME", "store_visits"),
-        user=os.environ.get("DB_USER", "store_tracker"),
-        password=os.environ.get("DB_PASSWORD")
-    )
+    conn = psycopg2.connect(**_connect_params())
     return conn
 
 
@@ -54,3 +125,39 @@ def release_db_connection(conn):
         conn.close()
     except Exception:
         pass
+
+
+def execute_prepared(cursor, name, sql, params=()):
+    """
+    Execute `sql` (written with $1, $2, ... placeholders) as a named prepared
+    statement. It is PREPAREd the first time it runs on a connection, so
+    later calls skip parsing and planning.
+    """
+    prepared = _prepared_statements.setdefault(cursor.connection, set())
+    if name not in prepared:
+        cursor.execute(f"PREPARE {name} AS {sql}")
+        prepared.add(name)
+
+    if params:
+        placeholders = ", ".join(["%s"] * len(params))
+        cursor.execute(f"EXECUTE {name}({placeholders})", params)
+    else:
+        cursor.execute(f"EXECUTE {name}")
+
+
+def daily_rollup_source(cursor):
+    """
+    FROM-clause source for the daily visit rollup: the materialized view
+    (with today's rows aggregated live) when migration 023 has been applied,
+    otherwise the equivalent GROUP BY over store_visits. Postgres pushes
+    "storeNbr"/calendar_date filters into either.
+    """
+    global _daily_rollup_exists
+    if not _daily_rollup_exists:
+        # Plain cursor so this works whatever cursor_factory the caller uses
+        with cursor.connection.cursor() as check:
+            check.execute("SELECT to_regclass('store_visit_daily_rollup') IS NOT NULL")
+            _daily_rollup_exists = check.fetchone()[0]
+        if not _daily_rollup_exists:
+            return f"({DAILY_ROLLUP_SELECT}) AS store_visit_daily_rollup"
+    return f"({DAILY_ROLLUP_WITH_TODAY_SELECT}) AS store_visit_daily_rollup"
@@ -2,22 +2,27 @@
 Walmart Fiscal Week Helper Functions
 """
 
-from datetime import date, timedelta
+import functools
+from datetime import date
+
+
+@functools.lru_cache(maxsize=8)
+def _first_saturday_ordinal(fiscal_year):
+    """Ordinal of the first Saturday on or after Jan 31 of `fiscal_year` (start of week 1)"""
+    fiscal_year_start = date(fiscal_year, 1, 31)
+    days_to_saturday = (5 - fiscal_year_start.weekday()) % 7
+    return fiscal_year_start.toordinal() + days_to_saturday
 
 
 def get_fiscal_week_number(week_start_date):
     """Calculate fiscal week number (Week 1 starts January 31st)"""
     year = week_start_date.year
 
-    fiscal_year_start = date(year, 1, 31)
-    if week_start_date < fiscal_year_start:
-        fiscal_year_start = date(year - 1, 1, 31)
+    # Dates before Jan 31 belong to the previous fiscal year
+    if week_start_date.month == 1 and week_start_date.day < 31:
+        year -= 1
 
-    # Find the first Saturday on or after Jan 31
-    days_to_saturday = (5 - fiscal_year_start.weekday()) % 7
-    first_saturday = fiscal_year_start + timedelta(days=days_to_saturday)
-
-    days_since_start = (week_start_date - first_saturday).days
+    days_since_start = week_start_date.toordinal() - _first_saturday_ordinal(year)
     week_number = (days_since_start // 7) + 1
 
     return week_number
@@ -25,24 +30,15 @@ def get_fiscal_week_number(week_start_date):
 
 def get_monday_from_fiscal_week(week_number, year=None):
     """Convert a fiscal week number to the Monday of that week"""
+    today = date.today()
     if year is None:
-        year = date.today().year
+        year = today.year
 
-    fiscal_year_start = date(year, 1, 31)
-    today = date.today()
+    fiscal_year = year
 
     # Handle high week numbers before Jan 31 (previous fiscal year)
-    if today < fiscal_year_start and week_number > 40:
-        fiscal_year_start = date(year - 1, 1, 31)
-
-    # Calculate the Saturday that starts this fiscal week
-    days_to_saturday = (5 - fiscal_year_start.weekday()) % 7
-    first_saturday = fiscal_year_start + timedelta(days=days_to_saturday)
-
-    # Get the Saturday for the requested week
-    target_saturday = first_saturday + timedelta(weeks=week_number - 1)
-
-    # Return the Monday of that week (Saturday + 2 days)
-    target_monday = target_saturday + timedelta(days=2)
+    if (today.year, today.month, today.day) < (year, 1, 31) and week_number > 40:
+        fiscal_year = year - 1
 
-    return target_monday
+    # The Saturday that starts the requested week, plus 2 days to its Monday
+    return date.fromordinal(_first_saturday_ordinal(fiscal_year) + 7 * (week_number - 1) + 2)
@@ -3,12 +3,66 @@ Notes Tools
 Tools for searching notes and managing market insights.
 """
 
-import json
-from datetime import datetime, timedelta
+from dataclasses import dataclass
+from datetime import date, timedelta
 from typing import Optional
 from psycopg2.extras import RealDictCursor
 
-from tools.db import get_db_connection, release_db_connection
+from tools.cache import ttl_cache
+from tools.db import execute_prepared, get_db_connection, release_db_connection
+from tools.serialization import to_json
+
+
+@dataclass(slots=True)
+class NoteMatch:
+    """One search_notes hit, built positionally from a tuple-cursor row"""
+    note_text: str
+    visit_id: int
+    storeNbr: str
+    calendar_date: date
+    rating: Optional[str]
+    note_type: str
+
+
+# (note_type, table) pairs searched by search_notes
+NOTE_SEARCH_TABLES = [
+    ('store', 'store_visit_notes'),
+    ('market', 'store_market_notes'),
+    ('good', 'store_good_notes'),
+    ('improvement', 'store_improvement_notes')
+]
+
+# Keywords shorter than this skip full-text search and go straight to ILIKE
+MIN_FULL_TEXT_LENGTH = 3
+
+
+def _note_search_sql(match, rank):
+    """UNION ALL of every note table filtered by `match`, best `rank` first"""
+    branches = [f"""
+        SELECT n.note_text, n.visit_id, v."storeNbr", v.calendar_date, v.rating,
+               '{note_type}' as note_type, {rank} as rank
+        FROM {table} n
+        JOIN store_visits v ON n.visit_id = v.id
+        WHERE {match}
+    """ for note_type, table in NOTE_SEARCH_TABLES]
+    return f"""
+        SELECT note_text, visit_id, "storeNbr", calendar_date, rating, note_type
+        FROM ({" UNION ALL ".join(branches)}) matches
+        ORDER BY rank DESC, calendar_date DESC
+        LIMIT $2
+    """
+
+
+# Both searches run as prepared statements (see execute_prepared): $1 is the
+# keyword or pattern, $2 the limit.
+# Full-text match served by the to_tsvector('english', note_text) GIN indexes in schema.sql
+FULL_TEXT_SEARCH_SQL = _note_search_sql(
+    "to_tsvector('english', n.note_text) @@ plainto_tsquery('english', $1)",
+    "ts_rank_cd(to_tsvector('english', n.note_text), plainto_tsquery('english', $1))"
+)
+
+# Substring match served by the trigram indexes (migrations/022_note_trigram_indexes.sql)
+SUBSTRING_SEARCH_SQL = _note_search_sql("n.note_text ILIKE $1", "0")
 
 
 def search_notes(keyword: str, limit: int = 20) -> str:
@@ -20,46 +74,37 @@ def search_notes(keyword: str, limit: int = 20) -> str:
         limit: Maximum number of results to return (default 20)
 
     Returns:
-        JSON string with matching notes and their associated visit info
+        JSON string with matching notes and their associated visit info,
+        most relevant first
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        note_tables = [
-            ('store', 'store_visit_notes'),
-            ('market', 'store_market_notes'),
-            ('good', 'store_good_notes'),
-            ('improvement', 'store_improvement_notes')
-        ]
-
-        results = []
-        search_pattern = f'%{keyword}%'
-
-        for note_type, table in note_tables:
-            cursor.execute(f"""
-                SELECT n.note_text, n.visit_id, v."storeNbr", v.calendar_date, v.rating,
-                       %s as note_type
-                FROM {table} n
-                JOIN store_visits v ON n.visit_id = v.id
-                WHERE LOWER(n.note_text) LIKE LOWER(%s)
-                ORDER BY v.calendar_date DESC
-                LIMIT %s
-            """, (note_type, search_pattern, limit))
-
-            for row in cursor.fetchall():
-                if row['calendar_date']:
-                    row['calendar_date'] = row['calendar_date'].isoformat()
-                results.append(dict(row))
-
-        cursor.close()
-
-        results.sort(key=lambda x: x.get('calendar_date', ''), reverse=True)
-        return json.dumps(results[:limit], default=str)
+        with conn.cursor() as cursor:
+            rows = []
+            if len(keyword.strip()) >= MIN_FULL_TEXT_LENGTH:
+                execute_prepared(cursor, "ps_search_notes_full_text", FULL_TEXT_SEARCH_SQL,
+                                 (keyword, limit))
+                rows = cursor.fetchall()
+
+            # Short keywords, stop words and partial words fall back to substring matching
+            if not rows:
+                execute_prepared(cursor, "ps_search_notes_substring", SUBSTRING_SEARCH_SQL,
+                                 (f'%{keyword}%', limit))
+                rows = cursor.fetchall()
+
+            results = [NoteMatch(*row) for row in rows]
+
+        return to_json(results)
     finally:
         release_db_connection(conn)
 
 
+# Cap on notes returned by get_market_insights; more than this is just noise to the LLM
+MAX_MARKET_INSIGHT_NOTES = 500
+
+
+# Re-requested often while the LLM reasons; serve stale for up to 20 min while refreshing
+@ttl_cache(ttl=600, stale_ttl=1200)
 def get_market_insights(days: int = 30) -> str:
     """
     Get aggregated market insights from all stores.
@@ -70,33 +115,38 @@ def get_market_insights(days: int = 30) -> str:
     Returns:
         JSON string with common market observations and themes
     """
+    start_date = date.today() - timedelta(days=days)
+
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        start_date = datetime.now() - timedelta(days=days)
-
-        cursor.execute("""
-            SELECT n.note_text, v."storeNbr", v.calendar_date
-            FROM store_market_notes n
-            JOIN store_visits v ON n.visit_id = v.id
-            WHERE v.calendar_date >= %s
-            ORDER BY v.calendar_date DESC
-        """, (start_date,))
-
-        notes = []
-        for row in cursor.fetchall():
-            if row['calendar_date']:
-                row['calendar_date'] = row['calendar_date'].isoformat()
-            notes.append(dict(row))
-
-        cursor.close()
-
-        return json.dumps({
-            "period_days": days,
-            "total_market_notes": len(notes),
-            "notes": notes
-        }, default=str)
+        with conn.cursor() as cursor:
+            # Postgres builds the whole response as one JSON document, so the
+            # notes arrive as a single bulk value with no per-row Python work.
+            # total_market_notes counts the whole window; notes holds the newest
+            # MAX_MARKET_INSIGHT_NOTES of them.
+            cursor.execute("""
+                WITH window_notes AS (
+                    SELECT n.note_text, v."storeNbr", v.calendar_date
+                    FROM store_market_notes n
+                    JOIN store_visits v ON n.visit_id = v.id
+                    WHERE v.calendar_date >= %(start_date)s
+                )
+                SELECT json_build_object(
+                    'period_days', %(days)s,
+                    'total_market_notes', (SELECT COUNT(*) FROM window_notes),
+                    'notes', COALESCE((
+                        SELECT json_agg(newest ORDER BY calendar_date DESC)
+                        FROM (
+                            SELECT * FROM window_notes
+                            ORDER BY calendar_date DESC
+                            LIMIT %(limit)s
+                        ) newest
+                    ), '[]'::json)
+                )::text
+            """, {'days': days, 'start_date': start_date, 'limit': MAX_MARKET_INSIGHT_NOTES})
+            insights_json = cursor.fetchone()[0]
+
+        return insights_json
     finally:
         release_db_connection(conn)
 
@@ -113,44 +163,36 @@ def get_market_note_status(status_filter: Optional[str] = None) -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        query = """
-            SELECT
-                smn.id, smn.visit_id, smn.note_text,
-                COALESCE(mnc.status, 'new') as status,
-                mnc.assigned_to,
-                COALESCE(mnc.completed, false) as completed,
-                mnc.completed_at,
-                v."storeNbr", v.calendar_date
-            FROM store_market_notes smn
-            JOIN store_visits v ON smn.visit_id = v.id
-            LEFT JOIN market_note_completions mnc
-                ON smn.visit_id = mnc.visit_id AND smn.note_text = mnc.note_text
-        """
-        params = []
-
-        if status_filter and status_filter.lower() == 'completed':
-            query += " WHERE COALESCE(mnc.status, 'new') = 'completed'"
-        elif status_filter:
-            query += " WHERE COALESCE(mnc.status, 'new') = %s"
-            params.append(status_filter)
-        else:
-            query += " WHERE COALESCE(mnc.status, 'new') != 'completed'"
-
-        query += " ORDER BY v.calendar_date DESC, smn.id DESC LIMIT 100"
-
-        cursor.execute(query, params)
-        notes = cursor.fetchall()
-
-        for note in notes:
-            if note.get('calendar_date'):
-                note['calendar_date'] = note['calendar_date'].isoformat()
-            if note.get('completed_at'):
-                note['completed_at'] = note['completed_at'].isoformat()
-
-        cursor.close()
-        return json.dumps(notes, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            query = """
+                SELECT
+                    smn.id, smn.visit_id, smn.note_text,
+                    COALESCE(mnc.status, 'new') as status,
+                    mnc.assigned_to,
+                    COALESCE(mnc.completed, false) as completed,
+                    mnc.completed_at,
+                    v."storeNbr", v.calendar_date
+                FROM store_market_notes smn
+                JOIN store_visits v ON smn.visit_id = v.id
+                LEFT JOIN market_note_completions mnc
+                    ON smn.visit_id = mnc.visit_id AND smn.note_text = mnc.note_text
+            """
+            params = []
+
+            if status_filter and status_filter.lower() == 'completed':
+                query += " WHERE COALESCE(mnc.status, 'new') = 'completed'"
+            elif status_filter:
+                query += " WHERE COALESCE(mnc.status, 'new') = %s"
+                params.append(status_filter)
+            else:
+                query += " WHERE COALESCE(mnc.status, 'new') != 'completed'"
+
+            query += " ORDER BY v.calendar_date DESC, smn.id DESC LIMIT 100"
+
+            cursor.execute(query, params)
+            notes = cursor.fetchall()
+
+        return to_json(notes)
     finally:
         release_db_connection(conn)
 
@@ -167,34 +209,27 @@ def get_market_note_updates(note_text: str = None) -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        query = """
-            SELECT
-                mnu.id, mnu.visit_id, mnu.note_text, mnu.update_text,
-                mnu.created_by, mnu.created_at,
-                v."storeNbr", v.calendar_date
-            FROM market_note_updates mnu
-            JOIN store_visits v ON mnu.visit_id = v.id
-        """
-        params = []
-
-        if note_text:
-            query += " WHERE LOWER(mnu.note_text) LIKE LOWER(%s)"
-            params.append(f'%{note_text}%')
-
-        query += " ORDER BY mnu.created_at DESC LIMIT 50"
-
-        cursor.execute(query, params)
-        updates = cursor.fetchall()
-
-        for update in updates:
-            if update.get('calendar_date'):
-                update['calendar_date'] = update['calendar_date'].isoformat()
-            if update.get('created_at'):
-                update['created_at'] = update['created_at'].isoformat()
-
-        cursor.close()
-        return json.dumps(updates, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            query = """
+                SELECT
+                    mnu.id, mnu.visit_id, mnu.note_text, mnu.update_text,
+                    mnu.created_by, mnu.created_at,
+                    v."storeNbr", v.calendar_date
+                FROM market_note_updates mnu
+                JOIN store_visits v ON mnu.visit_id = v.id
+            """
+            params = []
+
+            if note_text:
+                # ILIKE so the trigram index from migrations/025 can serve it
+                query += " WHERE mnu.note_text ILIKE %s"
+                params.append(f'%{note_text}%')
+
+            query += " ORDER BY mnu.created_at DESC LIMIT 50"
+
+            cursor.execute(query, params)
+            updates = cursor.fetchall()
+
+        return to_json(updates)
     finally:
         release_db_connection(conn)
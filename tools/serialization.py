@@ -0,0 +1,42 @@
+"""
+JSON serialization helpers for JaxAI tools.
+"""
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime
+from decimal import Decimal
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(obj):
+    """Encode values the JSON encoder doesn't handle natively"""
+    if isinstance(obj, (date, datetime)):
+        return obj.isoformat()
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if is_dataclass(obj):
+        return asdict(obj)
+    return str(obj)
+
+
+def to_json(obj) -> str:
+    """Serialize a tool result to a JSON string (orjson when available)
+
+    Dataclass rows (e.g. NoteMatch) are encoded natively by orjson and via
+    asdict() by the stdlib fallback.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(obj, default=_default)
+
+
+def from_json(text):
+    """Parse a tool's JSON string result (orjson when available)"""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
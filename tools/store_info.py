@@ -2,11 +2,12 @@
 Store Information Tool for Jax AI.
 """
 
-import json
 from typing import Optional
 from psycopg2.extras import RealDictCursor
 
+from tools.cache import ttl_cache
 from tools.db import get_db_connection, release_db_connection
+from tools.serialization import to_json
 
 def get_store_information(store_number: Optional[str] = None) -> str:
     """
@@ -18,45 +19,40 @@ def get_store_information(store_number: Optional[str] = None) -> str:
     Returns:
         JSON string with the matched store details or a small list of highlighted operations data.
     """
-    conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        
-        if store_number:
-            cursor.execute("""
-                SELECT *
-                FROM store_info 
-                WHERE CAST(store_number AS VARCHAR) = %s
-            """, (store_number,))
-            result = cursor.fetchall()
-        else:
-            # When looking for broad store information without a specific store,
-            # pull a generalized sample or top-tier lists
-            cursor.execute("""
-                SELECT store_number, store_format, city, state, volume_tier, 
-                       complex_tier, store_manager, last_visit_date 
-                FROM store_info 
-                ORDER BY CAST(store_number AS INTEGER) ASC
-                LIMIT 50
-            """)
-            result = cursor.fetchall()
-            
-        # Format dates to avoid JSON serialization errors
-        for record in result:
-            if record.get('created_at'):
-                record['created_at'] = record['created_at'].isoformat()
-            if record.get('updated_at'):
-                record['updated_at'] = record['updated_at'].isoformat()
-            if record.get('last_visit_date'):
-                record['last_visit_date'] = record['last_visit_date'].isoformat()
+        return _fetch_store_information(store_number)
+    except Exception as e:
+        return to_json({"error": f"Database error fetching store info: {str(e)}"})
 
-        cursor.close()
+
+@ttl_cache(ttl=300)
+def _fetch_store_information(store_number: Optional[str]) -> str:
+    """get_store_information's lookup; database errors propagate so they aren't cached"""
+    conn = get_db_connection()
+    try:
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            if store_number:
+                cursor.execute("""
+                    SELECT *
+                    FROM store_info 
+                    WHERE CAST(store_number AS VARCHAR) = %s
+                """, (store_number,))
+                result = cursor.fetchall()
+            else:
+                # When looking for broad store information without a specific store,
+                # pull a generalized sample or top-tier lists
+                cursor.execute("""
+                    SELECT store_number, store_format, city, state, volume_tier, 
+                           complex_tier, store_manager, last_visit_date 
+                    FROM store_info 
+                    ORDER BY CAST(store_number AS INTEGER) ASC
+                    LIMIT 50
+                """)
+                result = cursor.fetchall()
         
         if not result:
-            return json.dumps({"message": f"No store information found for store {store_number}." if store_number else "No store info directory found."})
+            return to_json({"message": f"No store information found for store {store_number}." if store_number else "No store info directory found."})
             
-        return json.dumps(result, default=str)
-    except Exception as e:
-        return json.dumps({"error": f"Database error fetching store info: {str(e)}"})
+        return to_json(result)
     finally:
         release_db_connection(conn)
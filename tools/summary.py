@@ -3,12 +3,14 @@ Summary Tools
 Tools for getting overall statistics and summaries.
 """
 
-import json
 from psycopg2.extras import RealDictCursor
 
-from tools.db import get_db_connection, release_db_connection
+from tools.cache import ttl_cache
+from tools.db import daily_rollup_source, get_db_connection, release_db_connection
+from tools.serialization import to_json
 
 
+@ttl_cache(ttl=300)
 def get_summary_stats() -> str:
     """
     Get overall summary statistics for all store visits.
@@ -19,39 +21,25 @@ def get_summary_stats() -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        cursor.execute("""
-            SELECT
-                COUNT(*) as total_visits,
-                COUNT(DISTINCT "storeNbr") as unique_stores,
-                MIN(calendar_date) as first_visit,
-                MAX(calendar_date) as last_visit,
-                SUM(CASE WHEN rating = 'Green' THEN 1 ELSE 0 END) as green_count,
-                SUM(CASE WHEN rating = 'Yellow' THEN 1 ELSE 0 END) as yellow_count,
-                SUM(CASE WHEN rating = 'Red' THEN 1 ELSE 0 END) as red_count
-            FROM store_visits
-        """)
-        stats = cursor.fetchone()
-
-        # Get recent activity (last 30 days)
-        cursor.execute("""
-            SELECT COUNT(*) as recent_visits
-            FROM store_visits
-            WHERE calendar_date >= CURRENT_DATE - INTERVAL '30 days'
-        """)
-        recent = cursor.fetchone()
-
-        cursor.close()
-
-        result = dict(stats) if stats else {}
-        result['recent_visits_30d'] = recent['recent_visits'] if recent else 0
-
-        if result.get('first_visit'):
-            result['first_visit'] = result['first_visit'].isoformat()
-        if result.get('last_visit'):
-            result['last_visit'] = result['last_visit'].isoformat()
-
-        return json.dumps(result, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            # Served from the daily rollup (migrations/023_store_visit_daily_rollup.sql)
+            rollup = daily_rollup_source(cursor)
+            cursor.execute(f"""
+                SELECT
+                    COALESCE(SUM(visit_count), 0)::int as total_visits,
+                    COUNT(DISTINCT "storeNbr") as unique_stores,
+                    MIN(calendar_date) as first_visit,
+                    MAX(calendar_date) as last_visit,
+                    COALESCE(SUM(visit_count) FILTER (WHERE rating = 'Green'), 0)::int as green_count,
+                    COALESCE(SUM(visit_count) FILTER (WHERE rating = 'Yellow'), 0)::int as yellow_count,
+                    COALESCE(SUM(visit_count) FILTER (WHERE rating = 'Red'), 0)::int as red_count,
+                    COALESCE(SUM(visit_count) FILTER (
+                        WHERE calendar_date >= CURRENT_DATE - INTERVAL '30 days'
+                    ), 0)::int as recent_visits_30d
+                FROM {rollup}
+            """)
+            result = cursor.fetchone()
+
+        return to_json(dict(result))
     finally:
         release_db_connection(conn)
@@ -3,13 +3,15 @@ Team Tools
 Tools for managing champions, mentees, and contacts.
 """
 
-import json
 from typing import Optional
 from psycopg2.extras import RealDictCursor
 
+from tools.cache import ttl_cache
 from tools.db import get_db_connection, release_db_connection
+from tools.serialization import to_json
 
 
+@ttl_cache(ttl=300)
 def get_champions() -> str:
     """
     Get all champions (team members) and their responsibilities.
@@ -19,25 +21,20 @@ def get_champions() -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        cursor.execute("""
-            SELECT id, name, responsibility, created_at
-            FROM champions
-            ORDER BY name
-        """)
-        champions = cursor.fetchall()
-
-        for c in champions:
-            if c.get('created_at'):
-                c['created_at'] = c['created_at'].isoformat()
-
-        cursor.close()
-        return json.dumps(champions, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                SELECT id, name, responsibility, created_at
+                FROM champions
+                ORDER BY name
+            """)
+            champions = cursor.fetchall()
+
+        return to_json(champions)
     finally:
         release_db_connection(conn)
 
 
+@ttl_cache(ttl=300)
 def get_mentees(store_nbr: Optional[str] = None) -> str:
     """
     Get mentee circle members.
@@ -50,30 +47,24 @@ def get_mentees(store_nbr: Optional[str] = None) -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            query = """
+                SELECT id, name, store_nbr, position, cell_number, notes, created_at
+                FROM mentees
+                WHERE 1=1
+            """
+            params = []
 
-        query = """
-            SELECT id, name, store_nbr, position, cell_number, notes, created_at
-            FROM mentees
-            WHERE 1=1
-        """
-        params = []
+            if store_nbr:
+                query += " AND store_nbr = %s"
+                params.append(store_nbr)
 
-        if store_nbr:
-            query += " AND store_nbr = %s"
-            params.append(store_nbr)
+            query += " ORDER BY name"
 
-        query += " ORDER BY name"
+            cursor.execute(query, params)
+            mentees = cursor.fetchall()
 
-        cursor.execute(query, params)
-        mentees = cursor.fetchall()
-
-        for m in mentees:
-            if m.get('created_at'):
-                m['created_at'] = m['created_at'].isoformat()
-
-        cursor.close()
-        return json.dumps(mentees, default=str)
+        return to_json(mentees)
     finally:
         release_db_connection(conn)
 
@@ -168,55 +159,49 @@ def get_contacts(search_term: Optional[str] = None, department: Optional[str] =
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        query = """
-            SELECT id, name, store_number, title, department, reports_to, phone, email, notes, created_at
-            FROM contacts
-            WHERE 1=1
-        """
-        params = []
-
-        if search_term:
-            # Get all search variations (handles plurals, aliases)
-            search_variations = _normalize_search_term(search_term)
-
-            # Build OR conditions for each variation
-            or_conditions = []
-            for variation in search_variations:
-                or_conditions.append("""(LOWER(name) LIKE LOWER(%s)
-                                     OR LOWER(title) LIKE LOWER(%s)
-                                     OR LOWER(department) LIKE LOWER(%s)
-                                     OR LOWER(reports_to) LIKE LOWER(%s)
-                                     OR LOWER(notes) LIKE LOWER(%s))""")
-                search_pattern = f"%{variation}%"
-                params.extend([search_pattern] * 5)
-
-            if or_conditions:
-                query += " AND (" + " OR ".join(or_conditions) + ")"
-
-        if department:
-            dept_variations = _normalize_search_term(department)
-            dept_conditions = []
-            for variation in dept_variations:
-                dept_conditions.append("LOWER(department) LIKE LOWER(%s)")
-                params.append(f"%{variation}%")
-            if dept_conditions:
-                query += " AND (" + " OR ".join(dept_conditions) + ")"
-
-        query += " ORDER BY name"
-
-        cursor.execute(query, params)
-        contacts = cursor.fetchall()
-
-        for c in contacts:
-            if c.get('created_at'):
-                c['created_at'] = c['created_at'].isoformat()
-
-        cursor.close()
-        return json.dumps(contacts, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            query = """
+                SELECT id, name, store_number, title, department, reports_to, phone, email, notes, created_at
+                FROM contacts
+                WHERE 1=1
+            """
+            params = []
+
+            if search_term:
+                # Get all search variations (handles plurals, aliases)
+                search_variations = _normalize_search_term(search_term)
+
+                # Build OR conditions for each variation
+                or_conditions = []
+                for variation in search_variations:
+                    or_conditions.append("""(LOWER(name) LIKE LOWER(%s)
+                                         OR LOWER(title) LIKE LOWER(%s)
+                                         OR LOWER(department) LIKE LOWER(%s)
+                                         OR LOWER(reports_to) LIKE LOWER(%s)
+                                         OR LOWER(notes) LIKE LOWER(%s))""")
+                    search_pattern = f"%{variation}%"
+                    params.extend([search_pattern] * 5)
+
+                if or_conditions:
+                    query += " AND (" + " OR ".join(or_conditions) + ")"
+
+            if department:
+                dept_variations = _normalize_search_term(department)
+                dept_conditions = []
+                for variation in dept_variations:
+                    dept_conditions.append("LOWER(department) LIKE LOWER(%s)")
+                    params.append(f"%{variation}%")
+                if dept_conditions:
+                    query += " AND (" + " OR ".join(dept_conditions) + ")"
+
+            query += " ORDER BY name"
+
+            cursor.execute(query, params)
+            contacts = cursor.fetchall()
+
+        return to_json(contacts)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
     finally:
         release_db_connection(conn)
 
@@ -235,31 +220,30 @@ def log_associate_insight(contact_id: int, insight: str) -> str:
         JSON string indicating success or failure
     """
     if not str(contact_id).isdigit():
-        return json.dumps({"error": "contact_id must be a valid integer ID"})
+        return to_json({"error": "contact_id must be a valid integer ID"})
 
     conn = get_db_connection()
     if not conn:
-        return json.dumps({"error": "Database connection failed"})
+        return to_json({"error": "Database connection failed"})
 
     try:
-        cursor = conn.cursor()
-        cursor.execute("""
-            INSERT INTO associate_insights (contact_id, insight_text)
-            VALUES (%s, %s)
-            RETURNING id
-        """, (int(contact_id), insight))
-        inserted_id = cursor.fetchone()[0]
-        conn.commit()
-        cursor.close()
+        with conn.cursor() as cursor:
+            cursor.execute("""
+                INSERT INTO associate_insights (contact_id, insight_text)
+                VALUES (%s, %s)
+                RETURNING id
+            """, (int(contact_id), insight))
+            inserted_id = cursor.fetchone()[0]
+            conn.commit()
         
-        return json.dumps({
+        return to_json({
             "success": True, 
             "message": f"Successfully logged insight for Contact #{contact_id}.",
             "insight_id": inserted_id
         })
     except Exception as e:
         conn.rollback()
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
     finally:
         release_db_connection(conn)
 
@@ -277,30 +261,25 @@ def get_associate_insights(contact_id: int) -> str:
         JSON string containing all logged insights chronologically
     """
     if not str(contact_id).isdigit():
-        return json.dumps({"error": "contact_id must be a valid integer ID"})
+        return to_json({"error": "contact_id must be a valid integer ID"})
         
     conn = get_db_connection()
     if not conn:
-        return json.dumps({"error": "Database connection failed"})
+        return to_json({"error": "Database connection failed"})
         
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-        cursor.execute("""
-            SELECT ai.id, ai.contact_id, c.name as associate_name, ai.insight_text, ai.created_at
-            FROM associate_insights ai
-            JOIN contacts c ON ai.contact_id = c.id
-            WHERE ai.contact_id = %s
-            ORDER BY ai.created_at DESC
-        """, (int(contact_id),))
-        insights = cursor.fetchall()
-        
-        for ins in insights:
-            if ins.get('created_at'):
-                ins['created_at'] = ins['created_at'].isoformat()
-                
-        cursor.close()
-        return json.dumps(insights, default=str)
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            cursor.execute("""
+                SELECT ai.id, ai.contact_id, c.name as associate_name, ai.insight_text, ai.created_at
+                FROM associate_insights ai
+                JOIN contacts c ON ai.contact_id = c.id
+                WHERE ai.contact_id = %s
+                ORDER BY ai.created_at DESC
+            """, (int(contact_id),))
+            insights = cursor.fetchall()
+
+        return to_json(insights)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return to_json({"error": str(e)})
     finally:
         release_db_connection(conn)
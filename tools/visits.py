@@ -3,15 +3,98 @@ Store Visit Tools
 Tools for searching, viewing, analyzing, and comparing store visits.
 """
 
-import json
-from datetime import datetime, timedelta
+import functools
+import zlib
+from datetime import date, timedelta
 from typing import Optional
 from psycopg2.extras import RealDictCursor
 
-from tools.db import get_db_connection, release_db_connection
+from tools.cache import ttl_cache
+from tools.db import daily_rollup_source, execute_prepared, get_db_connection, release_db_connection
+from tools.serialization import to_json
+
+# (result key, table) pairs for the normalized note tables
+NOTE_TABLES = [
+    ('store_notes', 'store_visit_notes'),
+    ('market_notes', 'store_market_notes'),
+    ('good_notes', 'store_good_notes'),
+    ('top_3', 'store_improvement_notes')
+]
+
+# 'key', (notes for v.id as a JSON array) pairs for json_build_object
+NOTES_JSON = ",\n        ".join(
+    f"'{key}', COALESCE((SELECT json_agg(note_text ORDER BY sequence) "
+    f"FROM {table} WHERE visit_id = v.id), '[]'::json)"
+    for key, table in NOTE_TABLES
+)
+
+# Metric columns search_visits can return, in output order
+VISIT_METRICS = [
+    'sales_comp_yest', 'sales_comp_wtd', 'sales_comp_mtd',
+    'sales_index_yest', 'sales_index_wtd', 'sales_index_mtd',
+    'vizpick', 'overstock', 'picks', 'vizfashion', 'modflex',
+    'tag_errors', 'mods', 'pcs', 'pinpoint', 'ftpr', 'presub'
+]
+
+# Metrics returned when search_visits isn't asked for specific fields
+DEFAULT_VISIT_METRICS = ['sales_comp_wtd', 'vizpick', 'ftpr']
+
+
+@functools.lru_cache(maxsize=32)
+def _search_visits_sql(metrics):
+    """
+    (statement name, SQL) for search_visits returning `metrics` (a tuple in
+    VISIT_METRICS order). Run as a per-connection prepared statement (see
+    execute_prepared); Postgres builds the JSON document itself and the ::text
+    result is returned as-is.
+    """
+    metric_pairs = "".join(f"'{m}', v.{m}, " for m in metrics)
+    name = f"ps_search_visits_{zlib.crc32(','.join(metrics).encode()):08x}"
+    return name, f"""
+    SELECT COALESCE(json_agg(json_build_object(
+        'id', v.id, 'storeNbr', v."storeNbr", 'calendar_date', v.calendar_date, 'rating', v.rating,
+        {metric_pairs}
+        {NOTES_JSON}
+    ) ORDER BY v.calendar_date DESC), '[]'::json)::text
+    FROM (
+        SELECT * FROM store_visits
+        WHERE "storeNbr" = $1 AND ($2::text IS NULL OR LOWER(rating) = LOWER($2))
+        ORDER BY calendar_date DESC LIMIT $3
+    ) v
+"""
+
+
+VISIT_DETAILS_SQL = f"""
+    SELECT (to_jsonb(v) || jsonb_build_object(
+        {NOTES_JSON}
+    ))::text
+    FROM store_visits v
+    WHERE v.id = $1
+"""
+
+# Aggregated rows come back as one JSON array, in the order the stores were requested
+COMPARE_STORES_SQL = """
+    SELECT COALESCE(json_agg(s ORDER BY array_position($1::text[], s."storeNbr"::text)), '[]'::json)::text
+    FROM (
+        SELECT
+            "storeNbr",
+            COUNT(*) as total_visits,
+            COUNT(*) FILTER (WHERE rating = 'Green') as green_count,
+            COUNT(*) FILTER (WHERE rating = 'Yellow') as yellow_count,
+            COUNT(*) FILTER (WHERE rating = 'Red') as red_count,
+            AVG(sales_comp_wtd) as avg_sales_comp,
+            AVG(vizpick) as avg_vizpick,
+            AVG(ftpr) as avg_ftpr,
+            MAX(calendar_date) as last_visit
+        FROM store_visits
+        WHERE "storeNbr" = ANY($1::text[])
+        GROUP BY "storeNbr"
+    ) s
+"""
 
 
-def search_visits(store_nbr: str, limit: int = 10, rating: Optional[str] = None) -> str:
+def search_visits(store_nbr: str, limit: int = 10, rating: Optional[str] = None,
+                  fields: Optional[str] = None) -> str:
     """
     Search for recent visits to a specific store with full details including notes.
 
@@ -19,58 +102,33 @@ def search_visits(store_nbr: str, limit: int = 10, rating: Optional[str] = None)
         store_nbr: The store number to search for
         limit: Maximum number of visits to return (default 10)
         rating: Optional filter by rating (Green, Yellow, Red)
+        fields: Optional comma-separated metrics to include (e.g. "sales_comp_yest,overstock"),
+            or "all" for every metric. Defaults to sales_comp_wtd, vizpick and ftpr.
 
     Returns:
-        JSON string with visit details including all metrics and notes
+        JSON string with visit date, rating, the requested metrics and all notes
     """
+    if not fields:
+        metrics = DEFAULT_VISIT_METRICS
+    elif fields.strip().lower() == 'all':
+        metrics = VISIT_METRICS
+    else:
+        requested = {f.strip().lower() for f in fields.split(',') if f.strip()}
+        unknown = requested.difference(VISIT_METRICS)
+        if unknown:
+            return to_json({"error": f"Unknown fields: {', '.join(sorted(unknown))}. "
+                                     f"Valid fields: {', '.join(VISIT_METRICS)}"})
+        metrics = [m for m in VISIT_METRICS if m in requested]
+
+    name, sql = _search_visits_sql(tuple(metrics))
+
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        query = """
-            SELECT id, "storeNbr", calendar_date, rating,
-                   sales_comp_yest, sales_comp_wtd, sales_comp_mtd,
-                   sales_index_yest, sales_index_wtd, sales_index_mtd,
-                   vizpick, overstock, picks, vizfashion, modflex,
-                   tag_errors, mods, pcs, pinpoint, ftpr, presub
-            FROM store_visits
-            WHERE "storeNbr" = %s
-        """
-        params = [store_nbr]
-
-        if rating:
-            query += " AND LOWER(rating) = LOWER(%s)"
-            params.append(rating)
-
-        query += " ORDER BY calendar_date DESC LIMIT %s"
-        params.append(limit)
-
-        cursor.execute(query, params)
-        visits = cursor.fetchall()
-
-        # Get notes for each visit
-        for visit in visits:
-            visit_id = visit['id']
-
-            note_tables = [
-                ('store_notes', 'store_visit_notes'),
-                ('market_notes', 'store_market_notes'),
-                ('good_notes', 'store_good_notes'),
-                ('top_3', 'store_improvement_notes')
-            ]
-
-            for key, table in note_tables:
-                cursor.execute(f"""
-                    SELECT note_text FROM {table}
-                    WHERE visit_id = %s ORDER BY sequence
-                """, (visit_id,))
-                visit[key] = [row['note_text'] for row in cursor.fetchall()]
-
-            if visit['calendar_date']:
-                visit['calendar_date'] = visit['calendar_date'].isoformat()
-
-        cursor.close()
-        return json.dumps(visits, default=str)
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, name, sql, (store_nbr, rating or None, limit))
+            visits_json = cursor.fetchone()[0]
+
+        return visits_json
     finally:
         release_db_connection(conn)
 
@@ -87,40 +145,18 @@ def get_visit_details(visit_id: int) -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        cursor.execute("SELECT * FROM store_visits WHERE id = %s", (visit_id,))
-        visit = cursor.fetchone()
-
-        if not visit:
-            return json.dumps({"error": "Visit not found"})
-
-        note_tables = [
-            ('store_notes', 'store_visit_notes'),
-            ('market_notes', 'store_market_notes'),
-            ('good_notes', 'store_good_notes'),
-            ('top_3', 'store_improvement_notes')
-        ]
-
-        for key, table in note_tables:
-            cursor.execute(f"""
-                SELECT note_text FROM {table}
-                WHERE visit_id = %s ORDER BY sequence
-            """, (visit_id,))
-            visit[key] = [row['note_text'] for row in cursor.fetchall()]
-
-        cursor.close()
-
-        if visit.get('calendar_date'):
-            visit['calendar_date'] = visit['calendar_date'].isoformat()
-        if visit.get('created_at'):
-            visit['created_at'] = visit['created_at'].isoformat()
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "ps_visit_details_json", VISIT_DETAILS_SQL, (visit_id,))
+            row = cursor.fetchone()
 
-        return json.dumps(visit, default=str)
+        if not row:
+            return to_json({"error": "Visit not found"})
+        return row[0]
     finally:
         release_db_connection(conn)
 
 
+@ttl_cache(ttl=300)
 def analyze_trends(store_nbr: str, days: int = 90) -> str:
     """
     Analyze trends for a store over a period of time.
@@ -135,61 +171,65 @@ def analyze_trends(store_nbr: str, days: int = 90) -> str:
     """
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        start_date = datetime.now() - timedelta(days=days)
-
-        # Get rating distribution
-        cursor.execute("""
-            SELECT rating, COUNT(*) as count
-            FROM store_visits
-            WHERE "storeNbr" = %s AND calendar_date >= %s
-            GROUP BY rating
-        """, (store_nbr, start_date))
-        ratings = {row['rating']: row['count'] for row in cursor.fetchall()}
-
-        # Get average metrics
-        cursor.execute("""
-            SELECT
-                COUNT(*) as visit_count,
-                AVG(sales_comp_yest) as avg_sales_comp_yest,
-                AVG(sales_comp_wtd) as avg_sales_comp_wtd,
-                AVG(sales_comp_mtd) as avg_sales_comp_mtd,
-                AVG(vizpick) as avg_vizpick,
-                AVG(ftpr) as avg_ftpr,
-                AVG(overstock) as avg_overstock
-            FROM store_visits
-            WHERE "storeNbr" = %s AND calendar_date >= %s
-        """, (store_nbr, start_date))
-        averages = cursor.fetchone()
-
-        # Get recent trend (compare first half vs second half of period)
-        mid_date = datetime.now() - timedelta(days=days//2)
-        cursor.execute("""
-            SELECT
-                CASE WHEN calendar_date >= %s THEN 'recent' ELSE 'earlier' END as period,
-                AVG(sales_comp_wtd) as avg_sales_comp
-            FROM store_visits
-            WHERE "storeNbr" = %s AND calendar_date >= %s
-            GROUP BY CASE WHEN calendar_date >= %s THEN 'recent' ELSE 'earlier' END
-        """, (mid_date, store_nbr, start_date, mid_date))
-        trend_data = {row['period']: row['avg_sales_comp'] for row in cursor.fetchall()}
-
-        cursor.close()
+        with conn.cursor(cursor_factory=RealDictCursor) as cursor:
+            # Whole-day boundaries so results are stable for the life of a cache entry
+            start_date = date.today() - timedelta(days=days)
+            # Split point for the recent-vs-earlier trend (second half of period)
+            mid_date = date.today() - timedelta(days=days//2)
+
+            # Rating distribution, averages and trend in a single pass over the
+            # pre-aggregated daily rows (migrations/023_store_visit_daily_rollup.sql)
+            rollup = daily_rollup_source(cursor)
+            cursor.execute(f"""
+                WITH base AS (
+                    SELECT *
+                    FROM {rollup}
+                    WHERE "storeNbr" = %(store_nbr)s AND calendar_date >= %(start_date)s
+                )
+                SELECT
+                    (SELECT json_agg(json_build_array(rating, count))
+                     FROM (SELECT rating, SUM(visit_count)::int as count FROM base GROUP BY rating) r) as ratings,
+                    COALESCE(SUM(visit_count), 0)::int as visit_count,
+                    SUM(sales_comp_yest_sum) / NULLIF(SUM(sales_comp_yest_n), 0) as avg_sales_comp_yest,
+                    SUM(sales_comp_wtd_sum) / NULLIF(SUM(sales_comp_wtd_n), 0) as avg_sales_comp_wtd,
+                    SUM(sales_comp_mtd_sum) / NULLIF(SUM(sales_comp_mtd_n), 0) as avg_sales_comp_mtd,
+                    SUM(vizpick_sum) / NULLIF(SUM(vizpick_n), 0) as avg_vizpick,
+                    SUM(ftpr_sum) / NULLIF(SUM(ftpr_n), 0) as avg_ftpr,
+                    SUM(overstock_sum) / NULLIF(SUM(overstock_n), 0) as avg_overstock,
+                    SUM(visit_count) FILTER (WHERE calendar_date >= %(mid_date)s) as recent_count,
+                    SUM(sales_comp_wtd_sum) FILTER (WHERE calendar_date >= %(mid_date)s)
+                        / NULLIF(SUM(sales_comp_wtd_n) FILTER (WHERE calendar_date >= %(mid_date)s), 0) as recent_avg,
+                    SUM(visit_count) FILTER (WHERE calendar_date < %(mid_date)s) as earlier_count,
+                    SUM(sales_comp_wtd_sum) FILTER (WHERE calendar_date < %(mid_date)s)
+                        / NULLIF(SUM(sales_comp_wtd_n) FILTER (WHERE calendar_date < %(mid_date)s), 0) as earlier_avg
+                FROM base
+            """, {'store_nbr': store_nbr, 'start_date': start_date, 'mid_date': mid_date})
+            row = cursor.fetchone()
+
+        ratings = {rating: count for rating, count in row.pop('ratings') or []}
+
+        # Only report trend periods that actually had visits
+        trend_data = {}
+        for period in ('recent', 'earlier'):
+            count = row.pop(f'{period}_count')
+            avg = row.pop(f'{period}_avg')
+            if count:
+                trend_data[period] = avg
 
         result = {
             "store_nbr": store_nbr,
             "period_days": days,
             "rating_distribution": ratings,
-            "averages": dict(averages) if averages else {},
+            "averages": dict(row),
             "trend": trend_data
         }
 
-        return json.dumps(result, default=str)
+        return to_json(result)
     finally:
         release_db_connection(conn)
 
 
+@ttl_cache(ttl=300)
 def compare_stores(store_list: str) -> str:
     """
     Compare metrics across multiple stores.
@@ -200,35 +240,17 @@ def compare_stores(store_list: str) -> str:
     Returns:
         JSON string with side-by-side comparison of key metrics for each store
     """
-    stores = [s.strip() for s in store_list.split(',')]
+    # Strip, drop blanks and de-duplicate while keeping the requested order
+    stores = tuple(dict.fromkeys(s.strip() for s in store_list.split(',') if s.strip()))
+    if not stores or not all(s.isdigit() for s in stores):
+        return to_json({"error": "store_list must be comma-separated store numbers"})
+
     conn = get_db_connection()
     try:
-        cursor = conn.cursor(cursor_factory=RealDictCursor)
-
-        results = []
-        for store_nbr in stores:
-            cursor.execute("""
-                SELECT
-                    "storeNbr",
-                    COUNT(*) as total_visits,
-                    SUM(CASE WHEN rating = 'Green' THEN 1 ELSE 0 END) as green_count,
-                    SUM(CASE WHEN rating = 'Yellow' THEN 1 ELSE 0 END) as yellow_count,
-                    SUM(CASE WHEN rating = 'Red' THEN 1 ELSE 0 END) as red_count,
-                    AVG(sales_comp_wtd) as avg_sales_comp,
-                    AVG(vizpick) as avg_vizpick,
-                    AVG(ftpr) as avg_ftpr,
-                    MAX(calendar_date) as last_visit
-                FROM store_visits
-                WHERE "storeNbr" = %s
-                GROUP BY "storeNbr"
-            """, (store_nbr,))
-            row = cursor.fetchone()
-            if row:
-                if row.get('last_visit'):
-                    row['last_visit'] = row['last_visit'].isoformat()
-                results.append(dict(row))
+        with conn.cursor() as cursor:
+            execute_prepared(cursor, "ps_compare_stores_json", COMPARE_STORES_SQL, (list(stores),))
+            results_json = cursor.fetchone()[0]
 
-        cursor.close()
-        return json.dumps(results, default=str)
+        return results_json
     finally:
         release_db_connection(conn)